@@ -5,11 +5,20 @@ A class for analysing reinforced concrete beam section capacity using
 an Excel spreadsheet (RC Beam Design to AS3600 - 2018.xlsm).
 """
 
+import atexit
+import os
+import re
+import shutil
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterator, Literal, Optional
 
-import xlwings as xw
+if TYPE_CHECKING:
+    import xlwings as xw
 
 
 # -----------------------------------------------------------------------------
@@ -17,7 +26,7 @@ import xlwings as xw
 # -----------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectionGeometry:
     """
     Concrete beam section geometry.
@@ -42,7 +51,7 @@ class SectionGeometry:
             raise ValueError(f"width must be positive, got {self.width}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConcreteProperties:
     """
     Concrete material properties.
@@ -70,19 +79,36 @@ class ConcreteProperties:
 # Valid Australian standard bar sizes (diameter in mm)
 VALID_BAR_SIZES = frozenset({10, 12, 16, 20, 24, 28, 32, 36, 40})
 
+# Bit n is set when n is a valid bar size (see _is_valid_bar_size)
+_VALID_BAR_MASK = sum(1 << size for size in VALID_BAR_SIZES)
+_MAX_BAR_SIZE = max(VALID_BAR_SIZES)
+
 # Maximum number of reinforcement layers supported by spreadsheet
 MAX_REINFORCEMENT_LAYERS = 5
 
 
-@dataclass(frozen=True)
+def _is_valid_bar_size(bar_size) -> bool:
+    """Check bar_size against VALID_BAR_SIZES with an integer bit test."""
+    if type(bar_size) is not int:
+        # Accept integral floats such as 20.0, as the set membership test did
+        try:
+            if bar_size != int(bar_size):
+                return False
+        except (TypeError, ValueError, OverflowError):
+            return False
+        bar_size = int(bar_size)
+    return 0 <= bar_size <= _MAX_BAR_SIZE and (_VALID_BAR_MASK >> bar_size) & 1 == 1
+
+
+@dataclass(frozen=True, slots=True)
 class ReinforcementLayer:
     """
     Reinforcement layer configuration.
 
     Attributes:
         bar_size: Bar diameter in mm (must be valid Australian standard size)
-        spacings: List of bar spacings in mm for each layer (1-5 layers).
-                  Use 0 or omit to indicate no bars in that layer.
+        spacings: Bar spacings in mm for each layer (1-5 layers), stored as a
+                  tuple. Use 0 or omit to indicate no bars in that layer.
 
     Examples:
         Create a single layer of N20 bars at 150mm spacing:
@@ -100,9 +126,14 @@ class ReinforcementLayer:
 
     bar_size: int
     spacings: tuple[float, ...] = field(default_factory=tuple)
+    # Spacings padded with zeros to MAX_REINFORCEMENT_LAYERS, ready to write
+    padded_spacings: tuple[float, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        if self.bar_size not in VALID_BAR_SIZES:
+        # Lists are accepted too; a tuple keeps the layer hashable (see _cache_key)
+        object.__setattr__(self, "spacings", tuple(self.spacings))
+
+        if not _is_valid_bar_size(self.bar_size):
             raise ValueError(
                 f"bar_size must be one of {sorted(VALID_BAR_SIZES)}, got {self.bar_size}"
             )
@@ -119,6 +150,28 @@ class ReinforcementLayer:
                     f"spacing[{i}] must be non-negative, got {spacing}"
                 )
 
+        self._set_padded_spacings()
+
+    def _set_padded_spacings(self) -> None:
+        padding = (0,) * (MAX_REINFORCEMENT_LAYERS - len(self.spacings))
+        object.__setattr__(self, "padded_spacings", self.spacings + padding)
+
+    @classmethod
+    def unchecked(
+        cls, bar_size: int, spacings: tuple[float, ...] = ()
+    ) -> "ReinforcementLayer":
+        """
+        Create a ReinforcementLayer without validating it.
+
+        For trusted, already-validated inputs only; invalid values are not
+        caught here and will produce wrong spreadsheet results.
+        """
+        layer = object.__new__(cls)
+        object.__setattr__(layer, "bar_size", bar_size)
+        object.__setattr__(layer, "spacings", tuple(spacings))
+        layer._set_padded_spacings()
+        return layer
+
     @classmethod
     def from_spacings(cls, bar_size: int, *spacings: float) -> "ReinforcementLayer":
         """
@@ -130,7 +183,7 @@ class ReinforcementLayer:
         return cls(bar_size=bar_size, spacings=tuple(spacings))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppliedLoads:
     """
     Applied loads on the section.
@@ -180,23 +233,35 @@ class AppliedLoads:
             >>> forces = results.query_forces_moments(load_case_id=1, member_id=5)
             >>> loads = AppliedLoads.from_series(forces.iloc[0])
         """
-        # Build case-insensitive index lookup
-        index_map = {str(idx).lower(): idx for idx in series.index}
-
-        def get_value(name: str) -> float:
-            key = name.lower()
-            if key in index_map:
-                return float(series[index_map[key]])
-            return 0.0
-
-        return cls(
-            fx=get_value("fx"),
-            fy=get_value("fy"),
-            fz=get_value("fz"),
-            mx=get_value("mx"),
-            my=get_value("my"),
-            mz=get_value("mz"),
+        values = (
+            series.rename(index=lambda name: str(name).lower())
+            .reindex(_LOAD_FIELDS, fill_value=0.0)
+            .to_numpy(dtype=float)
         )
+        return cls(*values.tolist())
+
+    @classmethod
+    def from_frame(cls, frame) -> list["AppliedLoads"]:
+        """
+        Create AppliedLoads for every row of a pandas DataFrame.
+
+        Expected columns: fx, fy, fz, mx, my, mz (case-insensitive). Missing
+        columns default to zero.
+
+        Example:
+            >>> forces = results.query_forces_moments(member_id=5)
+            >>> loads_list = AppliedLoads.from_frame(forces)
+        """
+        values = (
+            frame.rename(columns=lambda name: str(name).lower())
+            .reindex(columns=_LOAD_FIELDS, fill_value=0.0)
+            .to_numpy(dtype=float)
+        )
+        return [cls(*row) for row in values.tolist()]
+
+
+# Load components in AppliedLoads field order
+_LOAD_FIELDS = ["fx", "fy", "fz", "mx", "my", "mz"]
 
 
 # -----------------------------------------------------------------------------
@@ -204,7 +269,7 @@ class AppliedLoads:
 # -----------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UtilisationResult:
     """
     Results from capacity analysis.
@@ -240,12 +305,24 @@ class UtilisationResult:
         return self.ultimate_utilisation <= 1.0 and self.serviceability_utilisation <= 1.0
 
 
+def _severity(loads: AppliedLoads) -> float:
+    """Rough severity estimate used to try likely failures first."""
+    return abs(loads.mz) + 0.1 * abs(loads.fx)
+
+
+# calculate_batch early_stop options
+_EARLY_STOP_CONDITIONS: dict[str, Callable[[UtilisationResult], bool]] = {
+    "first_failure": lambda result: not result.is_adequate,
+    "first_pass": lambda result: result.is_adequate,
+}
+
+
 # -----------------------------------------------------------------------------
 # Excel Cell Mapping
 # -----------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpreadsheetCells:
     """
     Mapping of spreadsheet cell references.
@@ -291,11 +368,119 @@ class SpreadsheetCells:
 # Default cell mapping
 DEFAULT_CELLS = SpreadsheetCells()
 
+# A1-style cell reference, e.g. "D33" -> ("D", "33")
+_CELL_PATTERN = re.compile(r"^([A-Z]+)([0-9]+)$")
+
+# Marks a cell with no cached value (distinct from None, a valid cell value)
+_UNWRITTEN = object()
+
+
+def _split_cell(cell: str) -> tuple[str, int]:
+    """Split an A1-style cell reference into its column letters and row number."""
+    match = _CELL_PATTERN.match(cell.upper())
+    if match is None:
+        raise ValueError(f"invalid cell reference: {cell!r}")
+    return match.group(1), int(match.group(2))
+
+
+def _column_number(column: str) -> int:
+    """Convert column letters to a 1-based column number (A -> 1, AA -> 27)."""
+    number = 0
+    for letter in column:
+        number = number * 26 + ord(letter) - ord("A") + 1
+    return number
+
+
+def _column_letters(number: int) -> str:
+    """Convert a 1-based column number back to column letters."""
+    letters = ""
+    while number:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def _contiguous_runs(values: dict[str, object]) -> Iterator[tuple[str, str, list]]:
+    """
+    Group cell values into vertically contiguous runs.
+
+    Each COM call through xlwings is a cross-process round-trip, so cells in
+    the same column on consecutive rows are written as a single block.
+
+    Yields:
+        (first_cell, last_cell, values) for each run, top to bottom
+    """
+    by_column: dict[str, list[tuple[int, str, object]]] = {}
+    for cell, value in values.items():
+        column, row = _split_cell(cell)
+        by_column.setdefault(column, []).append((row, cell, value))
+
+    for entries in by_column.values():
+        entries.sort(key=lambda entry: entry[0])
+        start = 0
+        for i in range(1, len(entries) + 1):
+            if i == len(entries) or entries[i][0] != entries[i - 1][0] + 1:
+                run = entries[start:i]
+                yield run[0][1], run[-1][1], [value for _, _, value in run]
+                start = i
+
+
+def _python_scalar(value: object) -> object:
+    """Convert a NumPy scalar to the Python number it holds, passing others through."""
+    item = getattr(value, "item", None)
+    return item() if item is not None else value
+
+
+def _gap_cells(cells, max_gap: int = 1) -> list[str]:
+    """
+    Find short vertical gaps between cells in the same column.
+
+    Returns the cells in gaps of at most max_gap rows, e.g. ["D34"] for
+    D33 and D35. Filling these lets a column be written as one block.
+    """
+    rows_by_column: dict[str, list[int]] = {}
+    for cell in cells:
+        column, row = _split_cell(cell)
+        rows_by_column.setdefault(column, []).append(row)
+
+    gaps = []
+    for column, rows in rows_by_column.items():
+        rows.sort()
+        for above, below in zip(rows, rows[1:]):
+            if 1 < below - above <= max_gap + 1:
+                gaps.extend(f"{column}{row}" for row in range(above + 1, below))
+    return gaps
+
 
 # -----------------------------------------------------------------------------
 # Main Analyser Class
 # -----------------------------------------------------------------------------
 
+# xlwings module, imported on first use (see _xlwings)
+_xw = None
+
+
+def _xlwings():
+    """
+    Import xlwings on first use.
+
+    Importing xlwings is slow (it loads the COM bindings), so it is deferred
+    until a workbook is actually opened. Code that only uses the dataclasses
+    never pays for it.
+    """
+    global _xw
+    if _xw is None:
+        import xlwings
+
+        _xw = xlwings
+    return _xw
+
+
+# Default spreadsheet, shipped alongside this module
+_DEFAULT_SPREADSHEET_PATH = (
+    Path(__file__).parent / "RC Beam Design to AS3600 - 2018.xlsm"
+)
+
 
 class ConcreteCapacityAnalyser:
     """
@@ -315,6 +500,17 @@ class ConcreteCapacityAnalyser:
         result = analyser.calculate(geometry, concrete, top_reo, bottom_reo, loads)
         print(f"Utilisation: {result.ultimate_utilisation:.2%}")
 
+    Each calculation opens and closes the workbook unless the analyser is
+    used as a context manager (or created with keep_open=True), in which
+    case the workbook stays open until the block exits or close() is called:
+
+        with ConcreteCapacityAnalyser() as analyser:
+            for loads in loads_list:
+                result = analyser.calculate(geometry, concrete, top_reo, bottom_reo, loads)
+
+    The workbook is opened in a hidden Excel instance owned by the analyser,
+    which is reused between calculations and quit by close() (or at exit).
+
     Note on moment sign convention:
         - Positive mz: tension at bottom (standard beam configuration)
         - Negative mz: tension at top (hogging moment)
@@ -326,12 +522,15 @@ class ConcreteCapacityAnalyser:
     """
 
     # Default spreadsheet location (relative to this module)
-    DEFAULT_SPREADSHEET = "RC Beam Design to AS3600 - 2018.xlsm"
+    DEFAULT_SPREADSHEET = _DEFAULT_SPREADSHEET_PATH.name
 
     def __init__(
         self,
         spreadsheet_path: Optional[Path | str] = None,
         cells: Optional[SpreadsheetCells] = None,
+        keep_open: bool = False,
+        cache_size: int = 256,
+        validate: bool = True,
     ) -> None:
         """
         Initialize the analyser.
@@ -340,20 +539,80 @@ class ConcreteCapacityAnalyser:
             spreadsheet_path: Path to the Excel spreadsheet. If None, uses
                               the default spreadsheet in the src directory.
             cells: Custom cell mapping. If None, uses default mapping.
+            keep_open: If True, the workbook is opened on first use and kept
+                       open across calculations until close() is called.
+            cache_size: Number of recent results to remember, so repeated
+                        inputs skip the Excel solve. 0 disables the cache.
+            validate: If False, skip checking that the spreadsheet exists
+                      (for paths the caller has already checked).
         """
         if spreadsheet_path is None:
             # Default to spreadsheet in same directory as this module
-            self.spreadsheet_path = Path(__file__).parent / self.DEFAULT_SPREADSHEET
+            self.spreadsheet_path = _DEFAULT_SPREADSHEET_PATH
         else:
             self.spreadsheet_path = Path(spreadsheet_path)
 
-        if not self.spreadsheet_path.exists():
+        if validate and not self.spreadsheet_path.exists():
             raise FileNotFoundError(
                 f"Spreadsheet not found: {self.spreadsheet_path}"
             )
 
         self.cells = cells or DEFAULT_CELLS
 
+        # Open workbook session (see _session)
+        self._keep_open = keep_open
+        self._app: Optional["xw.App"] = None
+        self._quit_guard: Optional[Callable[[], None]] = None
+        self._workbook: Optional["xw.Book"] = None
+        self._sheet: Optional["xw.Sheet"] = None
+        self._solve = None
+        self._written: dict[str, object] = {}
+        self._ranges: dict[tuple[str, Optional[str]], "xw.Range"] = {}
+        self._ranges_sheet: Optional["xw.Sheet"] = None
+        self._section: Optional[tuple[SectionGeometry, ConcreteProperties]] = None
+
+        # Recent results, least recently used first (see _cache_key)
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple, UtilisationResult] = OrderedDict()
+
+    def __enter__(self) -> "ConcreteCapacityAnalyser":
+        self._keep_open = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the workbook and quit the analyser's Excel instance.
+
+        Safe to call more than once. The analyser can still be used
+        afterwards; a new Excel instance is started on the next calculation.
+        """
+        self._keep_open = False
+        self._close_workbook()
+
+        app = self._app
+        self._app = None
+        if self._quit_guard is not None:
+            atexit.unregister(self._quit_guard)
+            self._quit_guard = None
+        if app is not None:
+            app.quit()
+
+    def _close_workbook(self) -> None:
+        """Close the workbook, if open, and forget per-session state."""
+        workbook = self._workbook
+        self._workbook = None
+        self._sheet = None
+        self._solve = None
+        self._written = {}
+        self._ranges = {}
+        self._ranges_sheet = None
+        self._section = None
+        if workbook is not None:
+            workbook.close()
+
     def calculate(
         self,
         geometry: SectionGeometry,
@@ -388,23 +647,20 @@ class ConcreteCapacityAnalyser:
             >>> result = analyser.calculate(geometry, concrete, top_reo, bottom_reo, loads)
             >>> print(f"Utilisation: {result.ultimate_utilisation:.1%}")
         """
-        workbook = None
-        try:
-            workbook = xw.Book(str(self.spreadsheet_path))
-            sheet = workbook.sheets[0]
-
-            # Set section geometry and concrete properties
-            sheet[self.cells.depth].value = geometry.depth
-            sheet[self.cells.width].value = geometry.width
-            sheet[self.cells.concrete_strength].value = concrete.strength
+        key = self._cache_key(
+            geometry, concrete, top_reinforcement, bottom_reinforcement, loads
+        )
+        result = self._cached(key)
+        if result is not None:
+            return result
 
-            # Perform the calculation
-            return self._perform_single_calculation(
+        with self._session(geometry, concrete) as (sheet, workbook):
+            result = self._perform_single_calculation(
                 sheet, workbook, top_reinforcement, bottom_reinforcement, loads
             )
-        finally:
-            if workbook is not None:
-                workbook.close()
+
+        self._store(key, result)
+        return result
 
     def calculate_batch(
         self,
@@ -413,11 +669,17 @@ class ConcreteCapacityAnalyser:
         top_reinforcement: ReinforcementLayer,
         bottom_reinforcement: ReinforcementLayer,
         loads_list: list[AppliedLoads],
-    ) -> list[UtilisationResult]:
+        workers: Optional[int] = 1,
+        early_stop: Optional[Literal["first_failure", "first_pass"]] = None,
+    ) -> list[Optional[UtilisationResult]]:
         """
         Calculate capacity for multiple load cases efficiently.
 
-        Opens the workbook once and processes all load cases.
+        Uses a single workbook session for all load cases. Cases that repeat
+        an earlier (or cached) case are not re-solved. With more than one
+        worker, the remaining load cases are split into contiguous chunks and
+        solved in separate processes, each with its own hidden Excel instance
+        and copy of the spreadsheet.
 
         Args:
             geometry: Section dimensions (same for all cases)
@@ -425,53 +687,287 @@ class ConcreteCapacityAnalyser:
             top_reinforcement: Top reinforcement (same for all cases)
             bottom_reinforcement: Bottom reinforcement (same for all cases)
             loads_list: List of load cases to analyse
+            workers: Number of Excel processes to use. None uses half the
+                     available CPUs. Defaults to 1 (solve in this process).
+            early_stop: Stop at the first inadequate ("first_failure") or
+                        adequate ("first_pass") result. Cases are then solved
+                        one at a time, so workers is ignored. "first_failure"
+                        tries the most severe cases (largest |mz|, then |fx|)
+                        first; "first_pass" keeps input order.
 
         Returns:
-            List of UtilisationResult, one per load case
+            List of UtilisationResult in input order, one per load case. With
+            early_stop, cases not reached before stopping are None, so the
+            list still lines up with loads_list and the stopping case is the
+            one that meets the condition.
 
         Raises:
             RuntimeError: If Excel calculation fails or returns invalid results
+            ValueError: If early_stop is not a recognised value
 
         Example:
             >>> # Load forces from SPACEGASS for multiple load cases
             >>> forces_df = results.query_forces_moments(member_id=5)
-            >>> loads_list = [AppliedLoads.from_series(row) for _, row in forces_df.iterrows()]
+            >>> loads_list = AppliedLoads.from_frame(forces_df)
             >>> results = analyser.calculate_batch(geometry, concrete, top_reo, bottom_reo, loads_list)
             >>> for i, result in enumerate(results):
             ...     print(f"Case {i+1}: {result.ultimate_utilisation:.1%}")
         """
+        if early_stop is not None and early_stop not in _EARLY_STOP_CONDITIONS:
+            raise ValueError(
+                f"early_stop must be one of {sorted(_EARLY_STOP_CONDITIONS)} or None, "
+                f"got {early_stop!r}"
+            )
+
         if not loads_list:
             return []
 
-        results = []
-        workbook = None
+        keys = [
+            self._cache_key(
+                geometry, concrete, top_reinforcement, bottom_reinforcement, loads
+            )
+            for loads in loads_list
+        ]
+        results = [self._cached(key) for key in keys]
+
+        if early_stop is not None:
+            return self._calculate_until(
+                geometry, concrete, top_reinforcement, bottom_reinforcement,
+                loads_list, keys, results, early_stop,
+            )
 
-        try:
-            workbook = xw.Book(str(self.spreadsheet_path))
-            sheet = workbook.sheets[0]
+        # Group misses so duplicates are solved once
+        pending: dict[tuple, list[int]] = {}
+        for i, (key, result) in enumerate(zip(keys, results)):
+            if result is None:
+                pending.setdefault(key, []).append(i)
 
-            # Set geometry and concrete once (they don't change)
-            sheet[self.cells.depth].value = geometry.depth
-            sheet[self.cells.width].value = geometry.width
-            sheet[self.cells.concrete_strength].value = concrete.strength
+        if not pending:
+            return results
 
-            # Process each load case
-            for loads in loads_list:
-                result = self._perform_single_calculation(
-                    sheet, workbook, top_reinforcement, bottom_reinforcement, loads
-                )
-                results.append(result)
+        to_solve = [loads_list[indices[0]] for indices in pending.values()]
 
-        finally:
-            if workbook is not None:
-                workbook.close()
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 2) // 2)
+        workers = min(workers, len(to_solve))
+        if workers > 1:
+            solved = self._calculate_parallel(
+                geometry, concrete, top_reinforcement, bottom_reinforcement,
+                to_solve, workers,
+            )
+        else:
+            solved = []
+            with self._session(geometry, concrete) as (sheet, workbook):
+                for loads in to_solve:
+                    solved.append(self._perform_single_calculation(
+                        sheet, workbook, top_reinforcement, bottom_reinforcement, loads
+                    ))
+
+        for (key, indices), result in zip(pending.items(), solved):
+            self._store(key, result)
+            for i in indices:
+                results[i] = result
 
         return results
 
+    def _calculate_until(
+        self,
+        geometry: SectionGeometry,
+        concrete: ConcreteProperties,
+        top_reinforcement: ReinforcementLayer,
+        bottom_reinforcement: ReinforcementLayer,
+        loads_list: list[AppliedLoads],
+        keys: list[tuple],
+        results: list[Optional[UtilisationResult]],
+        early_stop: str,
+    ) -> list[Optional[UtilisationResult]]:
+        """
+        Solve cases one at a time, returning once the stop condition is met.
+
+        For "first_failure" the most severe cases are tried first, since they
+        are the most likely to fail. The workbook is only opened if a case
+        has to be solved. Cases not reached are None in the returned list,
+        even when their result is cached.
+        """
+        stop = _EARLY_STOP_CONDITIONS[early_stop]
+        order = range(len(loads_list))
+        if early_stop == "first_failure":
+            order = sorted(order, key=lambda i: _severity(loads_list[i]), reverse=True)
+
+        solved: dict[tuple, UtilisationResult] = {}
+        reached: list[Optional[UtilisationResult]] = [None] * len(loads_list)
+        with ExitStack() as stack:
+            sheet = workbook = None
+            for i in order:
+                result = results[i] or solved.get(keys[i])
+                if result is None:
+                    if sheet is None:
+                        sheet, workbook = stack.enter_context(
+                            self._session(geometry, concrete)
+                        )
+                    result = self._perform_single_calculation(
+                        sheet, workbook, top_reinforcement, bottom_reinforcement,
+                        loads_list[i],
+                    )
+                    self._store(keys[i], result)
+                    solved[keys[i]] = result
+                reached[i] = result
+                if stop(result):
+                    break
+
+        return reached
+
+    @staticmethod
+    def _orient(
+        top_reinforcement: ReinforcementLayer,
+        bottom_reinforcement: ReinforcementLayer,
+        loads: AppliedLoads,
+    ) -> tuple[ReinforcementLayer, ReinforcementLayer]:
+        """
+        Return (tension, compression) reinforcement for the moment direction.
+
+        Negative moment means tension is at top. Zero moment is treated as
+        positive (standard configuration).
+        """
+        if loads.mz < 0:
+            return top_reinforcement, bottom_reinforcement
+        return bottom_reinforcement, top_reinforcement
+
+    def _cache_key(
+        self,
+        geometry: SectionGeometry,
+        concrete: ConcreteProperties,
+        top_reinforcement: ReinforcementLayer,
+        bottom_reinforcement: ReinforcementLayer,
+        loads: AppliedLoads,
+    ) -> tuple:
+        """
+        Build the result cache key from everything written to the spreadsheet.
+
+        Loads are written as absolute values and fy/my are not used, so cases
+        that differ only in those respects share a key.
+        """
+        tension_reo, compression_reo = self._orient(
+            top_reinforcement, bottom_reinforcement, loads
+        )
+        return (
+            geometry,
+            concrete,
+            tension_reo,
+            compression_reo,
+            abs(loads.mz),
+            abs(loads.fx),
+            abs(loads.fz),
+            abs(loads.mx),
+        )
+
+    def _cached(self, key: tuple) -> Optional[UtilisationResult]:
+        """Return the cached result for key, marking it recently used."""
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        return result
+
+    def _store(self, key: tuple, result: UtilisationResult) -> None:
+        """Cache a result, evicting the least recently used beyond cache_size."""
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Forget all cached results (e.g. after editing the spreadsheet)."""
+        self._cache.clear()
+
+    def _calculate_parallel(
+        self,
+        geometry: SectionGeometry,
+        concrete: ConcreteProperties,
+        top_reinforcement: ReinforcementLayer,
+        bottom_reinforcement: ReinforcementLayer,
+        loads_list: list[AppliedLoads],
+        workers: int,
+    ) -> list[UtilisationResult]:
+        """Solve contiguous chunks of load cases in separate Excel processes."""
+        chunk_size = -(-len(loads_list) // workers)
+        chunks = [
+            loads_list[start:start + chunk_size]
+            for start in range(0, len(loads_list), chunk_size)
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=len(chunks),
+            initializer=_init_worker,
+            initargs=(self.spreadsheet_path, self.cells),
+        ) as executor:
+            chunk_results = executor.map(
+                _calculate_chunk,
+                [
+                    (geometry, concrete, top_reinforcement, bottom_reinforcement, chunk)
+                    for chunk in chunks
+                ],
+            )
+            return [result for results in chunk_results for result in results]
+
+    @contextmanager
+    def _session(
+        self,
+        geometry: SectionGeometry,
+        concrete: ConcreteProperties,
+    ) -> Iterator[tuple["xw.Sheet", "xw.Book"]]:
+        """
+        Provide an open workbook with the section inputs in place.
+
+        Reuses the open workbook when the analyser is kept open, otherwise
+        opens one for the duration of the block. The Excel instance itself
+        outlives the block and is reused until close(). Geometry and concrete cells
+        are only written when they differ from the last values written.
+
+        Yields:
+            (sheet, workbook) tuple
+        """
+        if self._workbook is None:
+            self._workbook = self._excel().books.open(str(self.spreadsheet_path))
+            self._sheet = self._workbook.sheets[0]
+            # Resolve the solver macro once per session
+            self._solve = self._workbook.macro(self.cells.solver_macro)
+
+        try:
+            with self._suspend_updates(self._workbook.app):
+                if self._section != (geometry, concrete):
+                    self._write_cells(
+                        self._sheet, self._section_values(geometry, concrete)
+                    )
+                    self._section = (geometry, concrete)
+
+                yield self._sheet, self._workbook
+        finally:
+            if not self._keep_open:
+                self._close_workbook()
+
+    def _excel(self) -> "xw.App":
+        """
+        Return the analyser's hidden Excel instance, starting it if needed.
+
+        A dedicated invisible instance avoids drawing a workbook window and
+        is shared by every calculation until close(). An atexit hook quits
+        it if close() is never called, so Excel processes don't accumulate.
+        """
+        if self._app is None:
+            app = _xlwings().App(visible=False, add_book=False)
+            app.display_alerts = False
+            app.screen_updating = False
+            self._app = app
+            self._quit_guard = app.quit
+            atexit.register(self._quit_guard)
+        return self._app
+
     def _perform_single_calculation(
         self,
-        sheet: xw.Sheet,
-        workbook: xw.Book,
+        sheet: "xw.Sheet",
+        workbook: "xw.Book",
         top_reinforcement: ReinforcementLayer,
         bottom_reinforcement: ReinforcementLayer,
         loads: AppliedLoads,
@@ -492,53 +988,169 @@ class ConcreteCapacityAnalyser:
         Returns:
             UtilisationResult with capacity check results
         """
-        # Determine if bars need to be flipped based on moment direction.
-        # Negative moment means tension is at top.
-        # Zero moment is treated as positive (standard configuration).
-        flip_bars = loads.mz < 0
-
-        if flip_bars:
-            tension_reo = top_reinforcement
-            compression_reo = bottom_reinforcement
-        else:
-            tension_reo = bottom_reinforcement
-            compression_reo = top_reinforcement
-
-        # Set bar sizes (tension bar goes to D16, compression to D15)
-        sheet[self.cells.top_bar_size].value = compression_reo.bar_size
-        sheet[self.cells.bottom_bar_size].value = tension_reo.bar_size
-
-        # Set bar spacings
-        self._set_spacings(sheet, self.cells.top_spacings, compression_reo.spacings)
-        self._set_spacings(sheet, self.cells.bottom_spacings, tension_reo.spacings)
+        # Flip bars based on moment direction
+        tension_reo, compression_reo = self._orient(
+            top_reinforcement, bottom_reinforcement, loads
+        )
 
-        # Set applied loads (use absolute values)
-        sheet[self.cells.ultimate_moment].value = abs(loads.mz)
-        sheet[self.cells.serviceability_moment].value = abs(loads.mz)
-        sheet[self.cells.axial_force].value = abs(loads.fx)
-        sheet[self.cells.shear_force].value = abs(loads.fz)
-        sheet[self.cells.torsion].value = abs(loads.mx)
+        values = {
+            # Bar sizes (tension bar goes to D16, compression to D15)
+            self.cells.top_bar_size: compression_reo.bar_size,
+            self.cells.bottom_bar_size: tension_reo.bar_size,
+            # Bar spacings
+            **dict(zip(self.cells.top_spacings, compression_reo.padded_spacings)),
+            **dict(zip(self.cells.bottom_spacings, tension_reo.padded_spacings)),
+            # Applied loads (use absolute values)
+            self.cells.ultimate_moment: abs(loads.mz),
+            self.cells.serviceability_moment: abs(loads.mz),
+            self.cells.axial_force: abs(loads.fx),
+            self.cells.shear_force: abs(loads.fz),
+            self.cells.torsion: abs(loads.mx),
+        }
+        self._write_cells(sheet, values)
 
-        # Run the solver macro
-        workbook.macro(self.cells.solver_macro)()
+        # Recalculate once now that all inputs are in place, then solve. Solver
+        # only changes its target cell, so with calculation on manual the
+        # result cells are recalculated again before they are read
+        workbook.app.calculate()
+        self._solve()
+        workbook.app.calculate()
 
         # Read and validate results
         return self._read_results(sheet)
 
-    def _set_spacings(
+    @staticmethod
+    @contextmanager
+    def _suspend_updates(app: "xw.App") -> Iterator[None]:
+        """
+        Suspend automatic recalculation, screen updating, events and alerts.
+
+        Without this every input write triggers a recalculation of its
+        dependent cells. The previous application settings are restored on exit.
+        """
+        calculation = app.calculation
+        screen_updating = app.screen_updating
+        enable_events = app.enable_events
+        display_alerts = app.display_alerts
+
+        app.calculation = "manual"
+        app.screen_updating = False
+        app.enable_events = False
+        app.display_alerts = False
+        try:
+            yield
+        finally:
+            app.calculation = calculation
+            app.screen_updating = screen_updating
+            app.enable_events = enable_events
+            app.display_alerts = display_alerts
+
+    def _section_values(
         self,
-        sheet: xw.Sheet,
-        cells: tuple[str, ...],
-        spacings: tuple[float, ...],
-    ) -> None:
-        """Set spacing values in spreadsheet cells, padding with zeros."""
-        for i, cell in enumerate(cells):
-            if i < len(spacings):
-                sheet[cell].value = spacings[i]
-            else:
-                sheet[cell].value = 0
+        geometry: SectionGeometry,
+        concrete: ConcreteProperties,
+    ) -> dict[str, float]:
+        """Map section geometry and concrete properties to their cells."""
+        return {
+            self.cells.depth: geometry.depth,
+            self.cells.width: geometry.width,
+            self.cells.concrete_strength: concrete.strength,
+        }
+
+    def _range(
+        self, sheet: "xw.Sheet", first: str, last: Optional[str] = None
+    ) -> "xw.Range":
+        """
+        Return the Range for first (or first:last), reusing it within a session.
 
-    def _read_results(self, sheet: xw.Sheet) -> UtilisationResult:
+        The cell groups are the same on every calculation, so each Range is
+        resolved once per open workbook instead of on every read and write.
+        """
+        if self._ranges_sheet is not sheet:
+            self._ranges = {}
+            self._ranges_sheet = sheet
+
+        key = (first, last)
+        rng = self._ranges.get(key)
+        if rng is None:
+            rng = sheet.range(first) if last is None else sheet.range(first, last)
+            self._ranges[key] = rng
+        return rng
+
+    def _write_cells(self, sheet: "xw.Sheet", values: dict[str, object]) -> None:
+        """
+        Write cell values, using one block write per contiguous run of cells.
+
+        Single-cell gaps between written cells (e.g. D34 between the load
+        cells) are read once per session and written back with their current
+        value, so each column goes out as one block. Gap cells must therefore
+        hold constants, not formulas. Runs whose values all match what was
+        last written in this session are skipped. Values go through
+        raw_value, which passes them straight to Excel without xlwings' type
+        conversion layer, so NumPy scalars (e.g. from DataFrame rows) are
+        converted to Python numbers first; COM cannot marshal them.
+        """
+        values = {cell: _python_scalar(value) for cell, value in values.items()}
+        written = self._written
+        gaps = _gap_cells(values)
+        if gaps:
+            for cell in gaps:
+                if cell not in written:
+                    written[cell] = self._range(sheet, cell).raw_value
+            values = {**{cell: written[cell] for cell in gaps}, **values}
+
+        for first, last, run in _contiguous_runs(values):
+            if first == last:
+                if written.get(first, _UNWRITTEN) == run[0]:
+                    continue
+                self._range(sheet, first).raw_value = run[0]
+                written[first] = run[0]
+                continue
+
+            column, row = _split_cell(first)
+            cells = [f"{column}{row + offset}" for offset in range(len(run))]
+            if all(
+                written.get(cell, _UNWRITTEN) == value
+                for cell, value in zip(cells, run)
+            ):
+                continue
+            self._range(sheet, first, last).raw_value = [[value] for value in run]
+            written.update(zip(cells, run))
+
+    def _read_cells(
+        self, sheet: "xw.Sheet", cells: tuple[str, ...]
+    ) -> dict[str, object]:
+        """
+        Read cell values using one range read per spreadsheet row.
+
+        Cells on the same row are fetched as a single block spanning them
+        (e.g. J8 and L8 are read together as J8:L8) and sliced in Python.
+        Results are numeric, so raw_value is used to skip type conversion.
+        """
+        by_row: dict[int, list[tuple[int, str]]] = {}
+        for cell in cells:
+            column, row = _split_cell(cell)
+            by_row.setdefault(row, []).append((_column_number(column), cell))
+
+        values: dict[str, object] = {}
+        for row, entries in by_row.items():
+            first = min(number for number, _ in entries)
+            last = max(number for number, _ in entries)
+            if first == last:
+                for _, cell in entries:
+                    values[cell] = self._range(sheet, cell).raw_value
+                continue
+
+            # raw_value returns a 2D block, even for a single row
+            block = self._range(
+                sheet, f"{_column_letters(first)}{row}", f"{_column_letters(last)}{row}"
+            ).raw_value[0]
+            for number, cell in entries:
+                values[cell] = block[number - first]
+
+        return values
+
+    def _read_results(self, sheet: "xw.Sheet") -> UtilisationResult:
         """
         Read and validate results from the spreadsheet.
 
@@ -551,10 +1163,19 @@ class ConcreteCapacityAnalyser:
         Raises:
             RuntimeError: If any result cell contains None or invalid data
         """
-        ultimate_util = sheet[self.cells.result_ultimate_utilisation].value
-        ultimate_str = sheet[self.cells.result_ultimate_strength].value
-        service_stress = sheet[self.cells.result_serviceability_stress].value
-        service_util = sheet[self.cells.result_serviceability_utilisation].value
+        values = self._read_cells(
+            sheet,
+            (
+                self.cells.result_ultimate_utilisation,
+                self.cells.result_ultimate_strength,
+                self.cells.result_serviceability_stress,
+                self.cells.result_serviceability_utilisation,
+            ),
+        )
+        ultimate_util = values[self.cells.result_ultimate_utilisation]
+        ultimate_str = values[self.cells.result_ultimate_strength]
+        service_stress = values[self.cells.result_serviceability_stress]
+        service_util = values[self.cells.result_serviceability_utilisation]
 
         # Validate that all results are present
         results = {
@@ -579,3 +1200,53 @@ class ConcreteCapacityAnalyser:
 
     def __repr__(self) -> str:
         return f"ConcreteCapacityAnalyser(spreadsheet_path='{self.spreadsheet_path}')"
+
+
+# -----------------------------------------------------------------------------
+# Parallel Batch Workers
+# -----------------------------------------------------------------------------
+
+# Per-process analyser, set up by _init_worker in each worker process
+_worker_analyser: Optional[ConcreteCapacityAnalyser] = None
+
+
+def _init_worker(spreadsheet_path: Path, cells: SpreadsheetCells) -> None:
+    """
+    Open a private Excel instance and spreadsheet copy for a worker process.
+
+    Excel keeps one copy of a workbook open per instance, so each worker
+    solves against its own copy in a temporary directory.
+    """
+    global _worker_analyser
+
+    temp_dir = tempfile.mkdtemp(prefix="concrete_capacity_")
+    copy_path = Path(temp_dir) / spreadsheet_path.name
+    shutil.copy2(spreadsheet_path, copy_path)
+
+    # The analyser starts its own hidden Excel instance on first use
+    analyser = ConcreteCapacityAnalyser(
+        copy_path, cells, keep_open=True, validate=False
+    )
+
+    def cleanup() -> None:
+        analyser.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    atexit.register(cleanup)
+    _worker_analyser = analyser
+
+
+def _calculate_chunk(
+    args: tuple[
+        SectionGeometry,
+        ConcreteProperties,
+        ReinforcementLayer,
+        ReinforcementLayer,
+        list[AppliedLoads],
+    ],
+) -> list[UtilisationResult]:
+    """Solve one chunk of load cases in a worker process."""
+    geometry, concrete, top_reinforcement, bottom_reinforcement, loads_list = args
+    return _worker_analyser.calculate_batch(
+        geometry, concrete, top_reinforcement, bottom_reinforcement, loads_list
+    )
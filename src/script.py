@@ -1,17 +1,26 @@
 from itertools import count
 
+import numpy as np
 import pandas as pd
 from io import StringIO
 import xlwings as xw
-from sg_results import SGResults
+from sg_results import load_results
 from pathlib import Path
 import subprocess
+import importlib.util
+import atexit
+import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, ttk
 import os
 
 first_column_name = "Run Name"
+capacity_spreadsheet = "RC Beam Design to AS3600 - 2018.xlsm"
 
 # gui_spacegass_selector.py
 # Requires: customtkinter (pip install customtkinter)
@@ -24,6 +33,10 @@ import customtkinter as ctk
 
 
 # ------------------------------------------- Co-pilot customtkinter GUI -----------------------------------------------
+# Runs the GUI's file checks off the Tk thread
+_validation_executor = ThreadPoolExecutor(max_workers=2)
+
+
 class SpaceGassSelectorApp(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -42,6 +55,10 @@ class SpaceGassSelectorApp(ctk.CTk):
         self.last_model_dir = os.getcwd()
         self.last_output_dir = os.getcwd()
 
+        # Pending debounced validation, and a counter so stale background results are ignored
+        self._validation_after_id = None
+        self._validation_generation = 0
+
         # ---------- Variables ----------
         self.model_file_var = tk.StringVar(value="")
         self.output_dir_var = tk.StringVar(value="")
@@ -67,7 +84,7 @@ class SpaceGassSelectorApp(ctk.CTk):
 
         self.ent_model = ctk.CTkEntry(file_frame, textvariable=self.model_file_var)
         self.ent_model.grid(row=0, column=1, padx=(0, 8), pady=12, sticky="ew")
-        self.ent_model.bind("<KeyRelease>", lambda e: self.validate_ready())
+        self.ent_model.bind("<KeyRelease>", lambda e: self.schedule_validation())
 
         btn_browse_file = ctk.CTkButton(file_frame, text="Browse…", command=self.browse_model_file, width=110)
         btn_browse_file.grid(row=0, column=2, padx=12, pady=12)
@@ -82,7 +99,7 @@ class SpaceGassSelectorApp(ctk.CTk):
 
         self.ent_out = ctk.CTkEntry(out_frame, textvariable=self.output_dir_var)
         self.ent_out.grid(row=0, column=1, padx=(0, 8), pady=12, sticky="ew")
-        self.ent_out.bind("<KeyRelease>", lambda e: self.validate_ready())
+        self.ent_out.bind("<KeyRelease>", lambda e: self.schedule_validation())
 
         btn_browse_out = ctk.CTkButton(out_frame, text="Browse…", command=self.browse_output_dir, width=110)
         btn_browse_out.grid(row=0, column=2, padx=12, pady=12)
@@ -158,9 +175,37 @@ class SpaceGassSelectorApp(ctk.CTk):
         """
         Validate that the inputs are usable. Enables the Analyse button if OK.
         """
+        self._validation_generation += 1
         model = self.model_file_var.get().strip()
         outdir = self.output_dir_var.get().strip()
+        self._apply_validation(self._validation_errors(model, outdir))
+
+    def schedule_validation(self, delay_ms=150):
+        """
+        Validate once typing pauses. The file checks can be slow on network drives, so they run on a
+        background thread and only the result is applied on the Tk thread.
+        """
+        if self._validation_after_id is not None:
+            self.after_cancel(self._validation_after_id)
+        self._validation_after_id = self.after(delay_ms, self._kickoff_validation)
 
+    def _kickoff_validation(self):
+        self._validation_after_id = None
+        self._validation_generation += 1
+        model = self.model_file_var.get().strip()
+        outdir = self.output_dir_var.get().strip()
+        future = _validation_executor.submit(self._validation_errors, model, outdir)
+        self._poll_validation(future, self._validation_generation)
+
+    def _poll_validation(self, future, generation):
+        # Tk widgets may only be touched from the Tk thread, so poll for the result rather than calling back
+        if not future.done():
+            self.after(20, self._poll_validation, future, generation)
+        elif generation == self._validation_generation:
+            self._apply_validation(future.result())
+
+    @staticmethod
+    def _validation_errors(model, outdir):
         errors = []
         if not model:
             errors.append("No SpaceGass file selected.")
@@ -179,6 +224,9 @@ class SpaceGassSelectorApp(ctk.CTk):
         elif not os.path.isdir(outdir):
             errors.append("Selected output folder does not exist.")
 
+        return errors
+
+    def _apply_validation(self, errors):
         if errors:
             msg = " • " + "\n • ".join(errors)
             self.status_var.set(msg)
@@ -188,7 +236,6 @@ class SpaceGassSelectorApp(ctk.CTk):
             self.btn_run.configure(state="normal")
 
     def on_run_clicked(self):
-        from pathlib import Path
         model = self.model_file_var.get().strip()
         outdir = self.output_dir_var.get().strip()
 
@@ -196,11 +243,9 @@ class SpaceGassSelectorApp(ctk.CTk):
         model_path = Path(model).expanduser().resolve()
         outdir_path = Path(outdir).expanduser().resolve()
         if not model_path.exists():
-            from tkinter import messagebox
             messagebox.showerror("Error", f"Model not found: {model_path}")
             return
         if not outdir_path.exists():
-            from tkinter import messagebox
             messagebox.showerror("Error", f"Output folder not found: {outdir_path}")
             return
 
@@ -240,9 +285,11 @@ def sg_quote_windows_path(p: str | Path) -> str:
     SpaceGass OPEN commands or command scripts.
     Ensures backslashes (\\), no mixed slashes, and existence check.
     """
-    path = Path(p).expanduser().resolve()
-    if not path.exists():
-        raise FileNotFoundError(f"SpaceGass model not found: {path}")
+    # A strict resolve checks existence on the way, so no separate exists() stat is needed
+    try:
+        path = Path(p).expanduser().resolve(strict=True)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"SpaceGass model not found: {Path(p).expanduser().absolute()}") from None
     # SpaceGass prefers Windows-style backslashes, but paths must be quoted if they have spaces
     win = path.as_posix()  # start from POSIX to avoid accidental escapes
     # Convert to backslashes:
@@ -272,7 +319,16 @@ def generate_output_file():
     pass
 
 
-def import_spacegass_script(master_excel):
+def import_spacegass_script(master_excel, max_workers=1, wait=True):
+    """
+    Write the SPACE GASS scripts exporting every row of the master Excel and run them.
+    :param master_excel: master Excel file with the run names, load cases and section filters
+    :param max_workers: number of SPACE GASS instances to run at once. Defaults to 1, a single script that opens the
+        model once and holds every export. With more, the rows are split into that many scripts, each opening the
+        model once, as several instances exporting to the same folder hasn't been shown to be safe
+    :param wait: wait for every run to finish and return the script paths. If False, return straight away with a
+        dict of output text name to the Future of the run exporting it, to pass to import_sg_output
+    """
     print("Importing SPACEGASS script into SPACEGASS")
 
     # Define some typical naming conventions
@@ -280,43 +336,71 @@ def import_spacegass_script(master_excel):
 
     # Use custom gui to determine pathing of SPACEGASS models
     model, outdir, sg_model_quoted = pick_spacegass_inputs()
+    if model is None:
+        print("No SPACEGASS model selected, nothing to run")
+        return [] if wait else {}
+
+    # Normalise once so mixed slashes from the file dialogs don't end up in the script
+    model_str = os.path.normpath(model)
+    outdir_str = os.path.normpath(outdir)
 
-    import_spacegass_model = 'ACTION OPEN ' '"' "File=" + str(model) + '"' + "\n"
+    import_spacegass_model = f'ACTION OPEN "File={model_str}"\n'
 
     default_header = "SPACE GASS Script File\n" "VERSION 14000000\n" "SHOW Normal\n" "SILENT\n" "CLOSE_AT_END\n"
-    default_output_name = "ACTION EXPORT_TXT " + '"' "File=" + str(outdir) + '\\'
 
     default_grabs = '"Stations=1" "ND=No" "MA=No" "ID=No" "IA=Yes" "PA=No" "PS=No" "NR=No" "BF=No" "BL=No" "DF=No" "DM=No" "SD=No" "MS=No"'
 
-    default_name = ""
-
-    # For writing the inputs to the SPACEGASS script file
-    count_rows = df_properties[first_column_name].notna().sum()
-    for i in range(count_rows):
-        default_name += default_output_name
-        default_name += str(df_properties.iloc[i][first_column_name]) + str(
-            df_properties.iloc[i]['Load Cases']) + '.txt" '
-        default_name += '"Cases=' + str(df_properties.iloc[i]['Load Cases']) + '" '
-        default_name += '"Filter=' + str(int(df_properties.iloc[i]['Section Filter Number'])) + '" '
-        default_name += default_grabs
-        default_name += "\n"
-
-    script_text = default_header + import_spacegass_model + default_name
-
-    # Then create the SPACEGASS script file
-    with open("script.TXT", "w") as f:
-        f.write(script_text)
-
-    # TODO Since the SPACE GASS script will always be created in the same directory as this script, simplify sg_script
-    sg_exe_dir = 'C:\Program Files\SPACE GASS 14.2\SGCore.exe'
-    sg_script = r'C:\Users\k146666\PyCharmMiscProject\script.txt'
-
-    sg_exe = fr'"{sg_exe_dir}" -n -s "{sg_script}"'
-
-    # TODO add wait in subprocess
-    subprocess.call(sg_exe)
-
-    return
+    # SPACE GASS wants a backslash between the output folder and file name whatever OS wrote the script
+    export_template = 'ACTION EXPORT_TXT "File={out}\\{name}" "Cases={cases}" "Filter={section_filter}" ' + default_grabs + "\n"
+
+    df_runs = run_rows(df_properties)
+    text_names = output_text_names(df_runs)
+    # Column names contain spaces, so read each row as a dict rather than through .iloc[i][...]
+    rows = df_runs.to_dict("records")
+    export_lines = [export_template.format(out=outdir_str, name=text_name, cases=row["Load Cases"],
+                                           section_filter=int(row["Section Filter Number"]))
+                    for row, text_name in zip(rows, text_names)]
+
+    # One script per SPACE GASS instance, each opening the model once and exporting a contiguous group of rows
+    script_count = max(1, min(max_workers, len(export_lines)))
+    group_size = -(-len(export_lines) // script_count) or 1
+    groups = [range(start, min(start + group_size, len(export_lines)))
+              for start in range(0, max(len(export_lines), 1), group_size)]
+
+    # For writing the inputs to the SPACEGASS script files
+    script_paths = []
+    for i, group in enumerate(groups):
+        script_text = "".join([default_header, import_spacegass_model, *(export_lines[row] for row in group)])
+
+        # Then create the SPACEGASS script file
+        script_path = Path("script.TXT" if len(groups) == 1 else f"script_{i + 1}.TXT").resolve()
+        with open(script_path, "w") as f:
+            f.write(script_text)
+        script_paths.append(script_path)
+
+    sg_exe_dir = r'C:\Program Files\SPACE GASS 14.2\SGCore.exe'
+
+    def run_script(script_path):
+        # Waits for SPACE GASS to finish, raising CalledProcessError if it fails
+        subprocess.run([sg_exe_dir, "-n", "-s", str(script_path)], check=True, capture_output=True)
+
+    executor = ThreadPoolExecutor(max_workers=len(script_paths))
+    runs = [executor.submit(run_script, script_path) for script_path in script_paths]
+    if not wait:
+        # The runs carry on in the background, this only stops the executor taking new work
+        executor.shutdown(wait=False)
+        return {text_names[row]: run for group, run in zip(groups, runs) for row in group}
+
+    try:
+        for run in runs:
+            run.result()
+    except BaseException:
+        # Drop any run not yet started and let the started ones finish, so no SPACE GASS instance is still writing
+        # into outdir once this raises
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown()
+    return script_paths
 
 def import_section_properties(section_properties_file):
     """
@@ -326,16 +410,52 @@ def import_section_properties(section_properties_file):
     """
 
     # TODO
-    df_properties = pd.read_excel(section_properties_file)  # pd.read_excel or something
+    # Cached on the path and modification time, so import_spacegass_script and import_sg_output share one read
+    # and a saved edit to the master Excel is read again
+    path = Path(section_properties_file).resolve()
+    df_properties = _read_section_properties(str(path), path.stat().st_mtime_ns)
 
     # This is how you get the ROW with Index 0
     # df_properties_row = df_properties.iloc[0]
     # This is how you get the Name WITHIN the row, for example I want the Section Name
 
-    return df_properties
+    # Copy so callers can't change the cached dataframe
+    return df_properties.copy()
+
+
+@lru_cache(maxsize=4)
+def _read_section_properties(path, mtime_ns):
+    return pd.read_excel(path, engine=excel_reader_engine())  # pd.read_excel or something
 
 
-def import_sg_output(master_excel):
+def excel_reader_engine():
+    """
+    Use the Rust based calamine reader when python-calamine is installed, it only reads cell values rather than
+    building openpyxl's full cell objects with styles.
+    """
+    return "calamine" if importlib.util.find_spec("python_calamine") is not None else None
+
+
+def run_rows(df_properties):
+    """
+    Rows of the master Excel to run, i.e. the first rows up to the number with a name filled in.
+    """
+    return df_properties.head(df_properties[first_column_name].notna().sum())
+
+
+def output_text_names(df_runs):
+    """
+    Names of the SPACE GASS output text files for each row of df_runs, built as one column operation.
+    """
+    return (df_runs[first_column_name].astype(str) + df_runs['Load Cases'].astype(str) + '.txt').tolist()
+
+
+def import_sg_output(master_excel, runs=None, workers=1):
+    """
+    :param runs: optional dict of output text name to SPACE GASS run, from import_spacegass_script(wait=False).
+        Each text file is read as soon as its run finishes, while later runs carry on
+    :param workers: number of Excel instances to calculate utilisations in, see calculate_utilisations
+    """
     # 1) Create the SPACE GASS script
     # import_spacegass_script(master_excel)
 
@@ -343,16 +463,17 @@ def import_sg_output(master_excel):
     print("Importing master Excel file")
     df_properties = import_section_properties(master_excel)
 
+    # Start Excel and open the capacity workbook now, while any SPACE GASS runs are still going
+    if workers <= 1:
+        load_capacity_workbook(capacity_spreadsheet)
+
     # 3) Create an array of text_files which SPACEGASS has exported
-    spacegass_output_texts = []
-    count_rows = df_properties[first_column_name].notna().sum()
+    df_runs = run_rows(df_properties)
 
     '''
     TODO need to update this so it work's with output texts from any folder, currently only works if the output texts are in the same folder as this script
     '''
-    for i in range(count_rows):
-        spacegass_output_texts.append(
-            str(df_properties.iloc[i][first_column_name]) + str(df_properties.iloc[i]['Load Cases']) + '.txt')
+    spacegass_output_texts = output_text_names(df_runs)
 
     # Define some column names
     column_names = ["Load Case", "Member ID", "Segment Number", "Segment Length", "Fx", "Fy", "Fz", "Mx", "My", "Mz"]
@@ -360,61 +481,80 @@ def import_sg_output(master_excel):
                           "Max or Min", "Depth", "Width", "Added Moment", "Mem 1", "Mem 2", "Mem 1 Max/Min",
                           "Mem 2 Max/Min"]
 
-    # Create a dataframe to store the results
-    df_results = pd.DataFrame(columns=column_names + additional_columns)
+    # Collect result rows in a list and build the dataframe once at the end,
+    # appending to a dataframe copies it on every row
+    result_columns = column_names + additional_columns
+    result_rows = []
+
+    # calculate_utilisation arguments for each result row, by row number, all calculated together at the end
+    utilisation_jobs = {}
 
     # 4) Iterate over the text files created AND the rows in the Excel (which are the SAME length)
-    for i, text_files in zip(range(count_rows), spacegass_output_texts):
+    # Read each row once as a dict rather than through .iloc[i][...] for every cell
+    property_rows = df_runs.to_dict("records")
+    for prop_row, text_files in zip(property_rows, spacegass_output_texts):
+        if runs is not None and text_files in runs:
+            # Wait for SPACE GASS to finish exporting this file, raising if its run failed
+            runs[text_files].result()
         print("Currently importing: ", text_files)
 
-        # print(df_properties.iloc[i]['Depth'], df_properties.iloc[i]['Width'], df_properties.iloc[i]['Top Bar Layer 1'], df_properties.iloc[i]['Btm Bar Layer 1'])
-
-        with open(text_files) as f:
-            lines = f.readlines()
+        # Section and reinforcement for this row, passed to every calculate_utilisation call below
+        section_args = (prop_row['Depth'], prop_row['Width'],
+                        prop_row['Top Bar Layer 1'], prop_row['Top Bar Layer 1 Spacing'], prop_row['Top Bar Layer 2 Spacing'],
+                        prop_row['Btm Bar Layer 1'], prop_row['Btm Bar Layer 1 Spacing'], prop_row['Btm Bar Layer 2 Spacing'])
 
         # Add a new line in the results Excel to separate different text files
-        first_col = df_results.columns[0]
-        df_results.loc[len(df_results)] = {first_col: text_files}
+        result_rows.append([text_files] + [None] * (len(result_columns) - 1))
 
         # Grab the relevant intermediate forces in the SPACE GASS output text file
         '''
         Using SGResults Class by Chris Leaman to create a dataframe for:
         Member Intermediate Forces and Moments stored into forces_df
         '''
-        results = SGResults(text_files)
+        results = load_results(text_files)
         forces_df = results.member_int_forces_moments
         section_df = results.sections
         member_df = results.members
 
-        # Iterate over maximum forces in Fz, Mx, My, Mz columns for each row in the Master Excel
-        for max_forces in ["fy", "fz", "mx", "my", "mz"]:
-            idx_max = forces_df[[max_forces]].idxmax().values[0]
-            idx_min = forces_df[[max_forces]].idxmin().values[0]
+        # Section of every member and width (col_19) of every section, looked up below
+        member_section = dict(zip(member_df['member_id'], member_df['section_id']))
+        section_width = dict(zip(section_df['section_id'], section_df['col_19']))
 
-            max_row = forces_df.loc[idx_max]
-            min_row = forces_df.loc[idx_min]
+        # Find the rows of the maximum and minimum of every force column in one pass
+        force_columns = ["fy", "fz", "mx", "my", "mz"]
+        force_values = forces_df[force_columns].to_numpy(dtype=float)
+        idx_maxes = np.nanargmax(force_values, axis=0)
+        idx_mins = np.nanargmin(force_values, axis=0)
+
+        # Largest and smallest mz of every member under every load case, instead of filtering forces_df per lookup.
+        # Members or load cases with no forces give NaN, as the max/min of an empty filter did
+        mz_extremes = forces_df.groupby(["member_id", "load_case_id"])["mz"].agg(["max", "min"])
+        mz_max = mz_extremes["max"].to_dict()
+        mz_min = mz_extremes["min"].to_dict()
+
+        # Iterate over maximum forces in Fz, Mx, My, Mz columns for each row in the Master Excel
+        for j, max_forces in enumerate(force_columns):
+            max_row = forces_df.iloc[idx_maxes[j]]
+            min_row = forces_df.iloc[idx_mins[j]]
 
-            # Find the two closest members using the average_moment function
+            # Find the two closest members using the find_adjacent_members function
             '''
             max_row['Member ID'] retrieves the member of the maximum row
             max_mem_1 retrieves the member above the maximum member
             max_mem_2 retrieves the member below the maximum member
             '''
+            # Cached per member, the extremes of different force columns are often on the same member
             max_mem_1, max_mem_2 = average_moment(text_files, max_row['member_id'])
             min_mem_1, min_mem_2 = average_moment(text_files, min_row['member_id'])
 
             # Filter the two closest members for 1. member, 2. the load case
             # This for maximum load case
-            max_mem_1_filtered = forces_df[
-                (forces_df['member_id'] == max_mem_1) & (forces_df['load_case_id'] == max_row['load_case_id'])]
-            max_mem_2_filtered = forces_df[
-                (forces_df['member_id'] == max_mem_2) & (forces_df['load_case_id'] == max_row['load_case_id'])]
+            max_mem_1_mz = mz_max.get((max_mem_1, max_row['load_case_id']), np.nan)
+            max_mem_2_mz = mz_max.get((max_mem_2, max_row['load_case_id']), np.nan)
 
             # This for minimum load case
-            min_mem_1_filtered = forces_df[
-                (forces_df['member_id'] == min_mem_1) & (forces_df['load_case_id'] == min_row['load_case_id'])]
-            min_mem_2_filtered = forces_df[
-                (forces_df['member_id'] == min_mem_2) & (forces_df['load_case_id'] == min_row['load_case_id'])]
+            min_mem_1_mz = mz_min.get((min_mem_1, min_row['load_case_id']), np.nan)
+            min_mem_2_mz = mz_min.get((min_mem_2, min_row['load_case_id']), np.nan)
 
             # TODO Retrieve section properties using SGResults, match all 3 members with the property "width"
             '''
@@ -424,290 +564,412 @@ def import_sg_output(master_excel):
             3. The member BELOW the maximum member
             '''
             # Retrieve the Section ID of the maximum member, and the two adjacent members
-            max_mem_section, max_mem_section_adj_1, max_mem_section_adj_2 = member_df[
-                member_df['member_id'] == max_row['member_id']]['section_id'], \
-                member_df[member_df['member_id'] == max_mem_1]['section_id'], \
-                member_df[member_df['member_id'] == max_mem_2]['section_id']
-            min_mem_section, min_mem_section_adj_1, min_mem_section_adj_2 = member_df[
-                member_df['member_id'] == min_row['member_id']]['section_id'], \
-                member_df[member_df['member_id'] == min_mem_1]['section_id'], \
-                member_df[member_df['member_id'] == min_mem_2]['section_id']
+            max_mem_section = member_section[max_row['member_id']]
+            max_mem_section_adj_1 = member_section.get(max_mem_1)
+            max_mem_section_adj_2 = member_section.get(max_mem_2)
+            min_mem_section = member_section[min_row['member_id']]
+            min_mem_section_adj_1 = member_section.get(min_mem_1)
+            min_mem_section_adj_2 = member_section.get(min_mem_2)
 
             # Retrieve the section width using the Section ID
-            max_mem_width = section_df[section_df['section_id'] == max_mem_section.item()]['col_19']
+            max_mem_width = section_width[max_mem_section]
             if max_mem_1 is not None:
-                max_mem_width_adj_1 = section_df[section_df['section_id'] == max_mem_section_adj_1.item()]['col_19']
+                max_mem_width_adj_1 = section_width[max_mem_section_adj_1]
             if max_mem_2 is not None:
-                max_mem_width_adj_2 = section_df[section_df['section_id'] == max_mem_section_adj_2.item()]['col_19']
+                max_mem_width_adj_2 = section_width[max_mem_section_adj_2]
 
-            min_mem_width = section_df[section_df['section_id'] == min_mem_section.item()]['col_19']
+            min_mem_width = section_width[min_mem_section]
             if min_mem_1 is not None:
-                min_mem_width_adj_1 = section_df[section_df['section_id'] == min_mem_section_adj_1.item()]['col_19']
+                min_mem_width_adj_1 = section_width[min_mem_section_adj_1]
             if min_mem_2 is not None:
-                min_mem_width_adj_2 = section_df[section_df['section_id'] == min_mem_section_adj_2.item()]['col_19']
+                min_mem_width_adj_2 = section_width[min_mem_section_adj_2]
 
             # Average the moment across the 3 members
-            max_avg_moment = (max_row.mz + max_mem_1_filtered["mz"].max() + max_mem_2_filtered["mz"].max()) / ((
-                        max_mem_width.item() + max_mem_width_adj_1.item() + max_mem_width_adj_2.item())/1000)
-            min_avg_moment = (min_row.mz + min_mem_1_filtered["mz"].min() + min_mem_2_filtered["mz"].min()) / ((
-                        min_mem_width.item() + min_mem_width_adj_1.item() + min_mem_width_adj_2.item())/1000)
+            max_avg_moment = (max_row.mz + max_mem_1_mz + max_mem_2_mz) / ((
+                        max_mem_width + max_mem_width_adj_1 + max_mem_width_adj_2)/1000)
+            min_avg_moment = (min_row.mz + min_mem_1_mz + min_mem_2_mz) / ((
+                        min_mem_width + min_mem_width_adj_1 + min_mem_width_adj_2)/1000)
 
             # Calculate maximum forces for "i" row in the Master Excel.
             # TODO CLEAN UP THE CALL UPS TO FUNCTION - PROBABLY CAN BE SIMPLIFIED
-            ultimate_utilisation, ultimate_strength, serviceability_btm_stress, serviceability_utilisation = calculate_utilisation(df_properties.iloc[i]['Depth'], df_properties.iloc[i]['Width'],df_properties.iloc[i]['Top Bar Layer 1'], df_properties.iloc[i]['Top Bar Layer 1 Spacing'],df_properties.iloc[i]['Top Bar Layer 2 Spacing'], df_properties.iloc[i]['Btm Bar Layer 1'],df_properties.iloc[i]['Btm Bar Layer 1 Spacing'], df_properties.iloc[i]['Btm Bar Layer 2 Spacing'],max_row.fx, max_row.fy, max_row.fz, max_row.mx, max_row.my, max_avg_moment)
+            utilisation_jobs[len(result_rows)] = (*section_args, max_row.fx, max_row.fy, max_row.fz, max_row.mx, max_row.my, max_avg_moment)
 
             # TODO need to clean up the max_row list as it's reading NaN values and creating too many columns, below code is a placeholder
-            max_list = []
+            max_list = max_row.to_numpy()[:10].tolist()
 
-            for a in range(0, 10):
-                max_list.append(list(max_row.values)[a])
-
-            df_results.loc[len(df_results)] = max_list + [ultimate_strength] + [ultimate_utilisation] + [serviceability_btm_stress] + [serviceability_utilisation] + ["max " + max_forces] + [df_properties.iloc[i]['Depth']] + [df_properties.iloc[i]['Width']] + [max_avg_moment] + [max_mem_1] + [max_mem_2] + [max_mem_1_filtered["mz"].max()] + [max_mem_2_filtered["mz"].max()]
+            # The four utilisation columns are filled in once calculated
+            result_rows.append(max_list + [None] * 4 + ["max " + max_forces] + [prop_row['Depth']] + [prop_row['Width']] + [max_avg_moment] + [max_mem_1] + [max_mem_2] + [max_mem_1_mz] + [max_mem_2_mz])
 
             # Calculate minimum forces for "i" row in the Master Excel
-            ultimate_utilisation, ultimate_strength, serviceability_btm_stress, serviceability_utilisation = calculate_utilisation(df_properties.iloc[i]['Depth'], df_properties.iloc[i]['Width'],df_properties.iloc[i]['Top Bar Layer 1'], df_properties.iloc[i]['Top Bar Layer 1 Spacing'],df_properties.iloc[i]['Top Bar Layer 2 Spacing'], df_properties.iloc[i]['Btm Bar Layer 1'],df_properties.iloc[i]['Btm Bar Layer 1 Spacing'], df_properties.iloc[i]['Btm Bar Layer 2 Spacing'],min_row.fx, min_row.fy, min_row.fz, min_row.mx, min_row.my, min_avg_moment)
-
-            min_list = []
+            utilisation_jobs[len(result_rows)] = (*section_args, min_row.fx, min_row.fy, min_row.fz, min_row.mx, min_row.my, min_avg_moment)
 
-            for b in range(0, 10):
-                min_list.append(list(min_row.values)[b])
+            min_list = min_row.to_numpy()[:10].tolist()
 
-            df_results.loc[len(df_results)] = min_list + [ultimate_strength] + [ultimate_utilisation] + [serviceability_btm_stress] + [serviceability_utilisation] + ["min " + max_forces] + [df_properties.iloc[i]['Depth']] + [df_properties.iloc[i]['Width']] + [min_avg_moment] + [min_mem_1] + [min_mem_2] + [min_mem_1_filtered["mz"].min()] + [min_mem_2_filtered["mz"].min()]
+            result_rows.append(min_list + [None] * 4 + ["min " + max_forces] + [prop_row['Depth']] + [prop_row['Width']] + [min_avg_moment] + [min_mem_1] + [min_mem_2] + [min_mem_1_mz] + [min_mem_2_mz])
 
         print(str(text_files) + " Done")
 
+    # Calculate every utilisation, then fill in Ultimate Strength, Ultimate Utilisation, Bar Stress and
+    # Serviceability Pass/Fail, which follow the ten force columns
+    utilisations = calculate_utilisations(list(utilisation_jobs.values()), workers=workers)
+    for row_number, (ultimate_utilisation, ultimate_strength, serviceability_btm_stress, serviceability_utilisation) \
+            in zip(utilisation_jobs, utilisations):
+        result_rows[row_number][10:14] = [ultimate_strength, ultimate_utilisation, serviceability_btm_stress,
+                                          serviceability_utilisation]
+
     # LAST: Compile results and print results file
     print("Printing output file")
     output_file = "results_file.xlsx"
-    df_results.to_excel(output_file, index=False)
+    df_results = pd.DataFrame(result_rows, columns=result_columns)
+    df_results.to_excel(output_file, index=False, engine=excel_writer_engine())
 
-    pass
+    # Done with the capacity Excel
+    close_capacity_workbooks()
+
+
+def excel_writer_engine():
+    """
+    Use xlsxwriter for writing results when it is installed, it is much faster than openpyxl for large sheets.
+    constant_memory mode is not used as pandas writes cells column by column, which that mode would drop.
+    """
+    return "xlsxwriter" if importlib.util.find_spec("xlsxwriter") is not None else None
 
 
 def average_moment(text_file, ref_member):
+    """
+    Find the parallel members either side of ref_member.
+
+    text_file is parsed once and the result for each member cached until the file changes, so repeated lookups
+    from the same file are cheap.
+    """
+    path = Path(text_file).resolve()
+    return _average_moment(str(path), path.stat().st_mtime_ns, ref_member)
+
+
+@lru_cache(maxsize=10_000)
+def _average_moment(path, mtime_ns, ref_member):
+    return find_adjacent_members(_load_member_geometry(path, mtime_ns), ref_member)
+
+
+def load_member_geometry(text_file):
+    """
+    member_geometry of a SPACE GASS output text file. Cached on the path and modification time, so the file is only
+    parsed again once it has been re-exported.
+    """
+    path = Path(text_file).resolve()
+    return _load_member_geometry(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_member_geometry(path, mtime_ns):
+    geometry = member_geometry(*parse_member_node_tables(path))
+    # Shared between callers, so don't let anyone change it
+    for array in geometry.values():
+        array.setflags(write=False)
+    return geometry
+
+
+def parse_member_node_tables(text_file):
+    """
+    Read the MEMBERS and NODES tables of a SPACE GASS output text file.
+    :return: (df_members, df_nodes)
+    """
     # Define column names
     member_column_names = ["Member ID", "PH0", "PH1", "PH2", "Y/N", "Node 1", "Node 2", "Section Number",
                            "Material Number", "Fixity 1", "Fixity 2", "PH3", "PH4", "PH5", "PH6", "PH7", "PH8", "PH9",
                            "PH10", "PH11"]
     node_column_names = ["Node ID", "x", "y", "z"]
 
-    # Open text files
+    # Open text files, read as one string so each table is a single slice rather than a joined list of lines
     with open(text_file) as f:
-        lines = f.readlines()
+        text = f.read()
+
+    # Find every table in one pass over the text
+    tables = _table_spans(text)
 
-    # Index of member start lines
     # TODO Andy to replace below code with Chris' updates
-    idx_members_start = lines.index("MEMBERS\n")
-    idx_members_end = lines.index("PLATES\n")
+    # The id columns used for geometry are typed up front, so they come back as int64 without inference
+    df_members = pd.read_csv(StringIO(_table_text(text, tables, "MEMBERS")), names=member_column_names,
+                             dtype={"Member ID": np.int64, "Node 1": np.int64, "Node 2": np.int64})
+    # Nodes are all numbers, so skip read_csv's type inference and parse them straight into a float array
+    node_values = np.loadtxt(StringIO(_table_text(text, tables, "NODES")), delimiter=",", ndmin=2)
+    df_nodes = pd.DataFrame(node_values, columns=node_column_names).astype({"Node ID": np.int64})
+
+    return df_members, df_nodes
+
+
+# Table headings are whole lines of capitals, e.g. NODES or MEMBER INTERMEDIATE FORCES AND MOMENTS
+_TABLE_HEADING_PATTERN = re.compile(r"^([A-Z][A-Z ]*)\n", re.MULTILINE)
+
 
-    member_data = lines[idx_members_start + 1:idx_members_end]
+def _table_spans(text):
+    """
+    Map each table heading of a SPACE GASS output text to the (start, end) offsets of its lines, which run up to the
+    next heading or the end of the text. Only the first table with a heading is kept.
+    """
+    matches = list(_TABLE_HEADING_PATTERN.finditer(text))
+    next_starts = [match.start() for match in matches[1:]] + [len(text)]
+    tables = {}
+    for match, next_start in zip(matches, next_starts):
+        tables.setdefault(match.group(1), (match.end(), next_start))
+    return tables
 
-    df_members = pd.read_csv(StringIO("".join(member_data)), names=member_column_names)
 
-    # Index of node start lines
-    idx_node_start = lines.index("NODES\n")
-    idx_node_end = lines.index("MEMBERS\n")
+def _table_text(text, tables, heading):
+    """
+    Return the lines of the heading table of a SPACE GASS output text.
+    """
+    span = tables.get(heading)
+    if span is None:
+        raise ValueError(f"No {heading} table in the SPACE GASS output text")
+    return text[span[0]:span[1]]
 
-    node_data = lines[idx_node_start + 1:idx_node_end]
 
-    df_nodes = pd.read_csv(StringIO("".join(node_data)), names=node_column_names)
+def member_geometry(df_members, df_nodes):
+    """
+    Pre-compute the end nodes, mid-points and direction vectors of every member, for find_adjacent_members.
+    """
+    # Look up node coordinates by row number instead of filtering df_nodes for every member
+    node_index = pd.Index(df_nodes["Node ID"])
+    node_coordinates = np.ascontiguousarray(df_nodes[["x", "y", "z"]].to_numpy(dtype=np.float64))
+
+    member_ids = df_members["Member ID"].to_numpy()
+    member_node_1 = df_members["Node 1"].to_numpy()
+    member_node_2 = df_members["Node 2"].to_numpy()
+
+    # Row of each member's end nodes in df_nodes, all members at once
+    node_1_rows = node_index.get_indexer(member_node_1)
+    node_2_rows = node_index.get_indexer(member_node_2)
+    missing = (node_1_rows < 0) | (node_2_rows < 0)
+    if missing.any():
+        raise KeyError(f"Members {member_ids[missing].tolist()} reference nodes missing from the NODES table")
+
+    # Coordinates of both ends of every member, then their mid-points and direction vectors
+    node_1_coordinates = node_coordinates[node_1_rows]
+    node_2_coordinates = node_coordinates[node_2_rows]
+    mid_points = 0.5 * (node_1_coordinates + node_2_coordinates)
+    direction_vectors = node_1_coordinates - node_2_coordinates
+    direction_magnitudes = np.sqrt(np.einsum("ij,ij->i", direction_vectors, direction_vectors))
+
+    return {
+        "member_ids": member_ids,
+        "member_node_1": member_node_1,
+        "member_node_2": member_node_2,
+        "mid_points": mid_points,
+        "direction_vectors": direction_vectors,
+        "direction_magnitudes": direction_magnitudes,
+    }
+
+
+def find_adjacent_members(geometry, ref_member):
+    """
+    Find the closest parallel members above and below ref_member.
+    :param geometry: member geometry from member_geometry
+    :return: (member above, member below), either of which may be None
+    """
+    member_ids = geometry["member_ids"]
+    member_node_1 = geometry["member_node_1"]
+    member_node_2 = geometry["member_node_2"]
+    mid_points = geometry["mid_points"]
+    direction_vectors = geometry["direction_vectors"]
+    direction_magnitudes = geometry["direction_magnitudes"]
 
     # Find the row where the reference member is, where ref_member is an input to the function
-    ref_member_row = df_members[df_members["Member ID"] == ref_member]
+    ref_row = np.flatnonzero(member_ids == ref_member).item()
 
     # Get the connecting nodes of the reference member
-    ref_node_1 = ref_member_row["Node 1"].item()
-    ref_node_2 = ref_member_row["Node 2"].item()
-
-    # Then get the coordinates of both connecting nodes
-    ref_node_1_coordinates = [df_nodes[df_nodes["Node ID"] == ref_node_1]['x'].item(),
-                              df_nodes[df_nodes["Node ID"] == ref_node_1]['y'].item(),
-                              df_nodes[df_nodes["Node ID"] == ref_node_1]['z'].item()]
-    ref_node_2_coordinates = [df_nodes[df_nodes["Node ID"] == ref_node_2]['x'].item(),
-                              df_nodes[df_nodes["Node ID"] == ref_node_2]['y'].item(),
-                              df_nodes[df_nodes["Node ID"] == ref_node_2]['z'].item()]
-
-    # Find the mid-point of the reference member
-    mid_point_ref = [(ref_node_2_coordinates[0] + ref_node_1_coordinates[0]) / 2,
-                     (ref_node_2_coordinates[1] + ref_node_1_coordinates[1]) / 2,
-                     (ref_node_2_coordinates[2] + ref_node_1_coordinates[2]) / 2]
-
-    # Find the vector value of the reference member
-    ref_vector = [ref_node_1_coordinates[0] - ref_node_2_coordinates[0],
-                  ref_node_1_coordinates[1] - ref_node_2_coordinates[1],
-                  ref_node_1_coordinates[2] - ref_node_2_coordinates[2]]
-    ref_vector_magnitude = (ref_vector[0] ** 2 + ref_vector[1] ** 2 + ref_vector[2] ** 2) ** 0.5
-
-    closest_above = [None, 1000]
-    closest_below = [None, 1000]
-
-    # TODO iterate through all members and do the same as the same of reference member and find the midpoint of the member, then compare to mid_point_ref
-    for i in range(len(df_members)):
-        node_1 = df_members.iloc[i]["Node 1"]
-        node_2 = df_members.iloc[i]["Node 2"]
-
-        node_1_coordinates = [float(df_nodes[df_nodes["Node ID"] == node_1]['x'].item()),
-                              float(df_nodes[df_nodes["Node ID"] == node_1]['y'].item()),
-                              float(df_nodes[df_nodes["Node ID"] == node_1]['z'].item())]
-        node_2_coordinates = [float(df_nodes[df_nodes["Node ID"] == node_2]['x'].item()),
-                              float(df_nodes[df_nodes["Node ID"] == node_2]['y'].item()),
-                              float(df_nodes[df_nodes["Node ID"] == node_2]['z'].item())]
-
-        direction_vector = [node_1_coordinates[0] - node_2_coordinates[0],
-                            node_1_coordinates[1] - node_2_coordinates[1],
-                            node_1_coordinates[2] - node_2_coordinates[2]]
-        direction_vector_magnitude = (direction_vector[0] ** 2 + direction_vector[1] ** 2 + direction_vector[
-            2] ** 2) ** 0.5
-
-        mid_point_member = [(node_2_coordinates[0] + node_1_coordinates[0]) / 2,
-                            (node_2_coordinates[1] + node_1_coordinates[1]) / 2,
-                            (node_2_coordinates[2] + node_1_coordinates[2]) / 2]
-
-        # Check Dot Product
-        dot_product = ref_vector[0] * direction_vector[0] + ref_vector[1] * direction_vector[1] + ref_vector[2] * \
-                      direction_vector[2]
-        # print(dot_product)
-        # Check value
-        cos_theta = dot_product / (ref_vector_magnitude * direction_vector_magnitude)
-
-        # Check distance from mid-point of reference member to mid-point of member
-        distance = (((mid_point_ref[0] - mid_point_member[0])) ** 2 + (
-            (mid_point_ref[1] - mid_point_member[1])) ** 2 + ((mid_point_ref[2] - mid_point_member[2])) ** 2) ** 0.5
-        # print(distance)
-        mid_point_dif = [float(mid_point_ref[0] - mid_point_member[0]), float(mid_point_ref[1] - mid_point_member[1]),
-                         float(mid_point_ref[2] - mid_point_member[2])]
-        # print(mid_point_dif)
-
-        moving_x = False
-        moving_z = False
-
-        if ref_vector[0] != 0:
-            moving_x = True
-        elif ref_vector[2] != 0:
-            moving_z = True
-
-        # TODO check if it is parallel or not
-        if abs(cos_theta) != 1.0:
-            continue
-
-        # TODO add an if to check similar nodes
-        if node_1 == ref_node_1 or node_2 == ref_node_2 or node_1 == ref_node_2 or node_2 == ref_node_1:
-            continue
-
-        # TODO function to change closest variable
-        # Check if the member is going in the x-direction and if it is:
-        if moving_x == True:
-            # Check whether it's going up
-            if mid_point_dif[2] > 0:
-                # Check whether the member in question is closer to the previous member
-                if distance < closest_above[1]:
-                    closest_above[0] = df_members.iloc[i]["Member ID"]
-                    closest_above[1] = distance
-            # Or down
-            elif mid_point_dif[2] < 0:
-                # Check whether the member in question is closer to the previous member
-                if distance < closest_below[1]:
-                    closest_below[0] = df_members.iloc[i]["Member ID"]
-                    closest_below[1] = distance
-
-        elif moving_z == True:
-            if mid_point_dif[0] > 0:
-                if distance < closest_above[1]:
-                    closest_above[0] = df_members.iloc[i]["Member ID"]
-                    closest_above[1] = distance
-            elif mid_point_dif[0] < 0:
-                if distance < closest_below[1]:
-                    closest_below[0] = df_members.iloc[i]["Member ID"]
-                    closest_below[1] = distance
-
-        # mid_point = [(node_1_coordinates[0]+node_2_coordinates[0])/2, (node_1_coordinates[1]+node_2_coordinates[1])/2, (node_1_coordinates[2]+node_2_coordinates[2])/2]
-
-    # print(mid_point_ref)
-
-    return closest_above[0], closest_below[0]
+    ref_node_1 = member_node_1[ref_row]
+    ref_node_2 = member_node_2[ref_row]
+
+    # Mid-point and vector of the reference member
+    mid_point_ref = mid_points[ref_row]
+    ref_vector = direction_vectors[ref_row]
+    ref_vector_magnitude = direction_magnitudes[ref_row]
+
+    # Only parallel members that don't share a node with the reference member are candidates
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_theta = (direction_vectors @ ref_vector) / (ref_vector_magnitude * direction_magnitudes)
+    parallel = np.isclose(np.abs(cos_theta), 1.0)
+    ref_nodes = [ref_node_1, ref_node_2]
+    shared_node = np.isin(member_node_1, ref_nodes) | np.isin(member_node_2, ref_nodes)
+
+    # Distance from mid-point of reference member to mid-point of every member
+    mid_point_difs = mid_point_ref - mid_points
+    distances = np.sqrt((mid_point_difs ** 2).sum(axis=1))
+
+    # Members further than 1000 away are never considered adjacent
+    candidates = parallel & ~shared_node & (distances < 1000)
+
+    # A member running in x is compared on z, a member running in z is compared on x
+    if ref_vector[0] != 0:
+        offsets = mid_point_difs[:, 2]
+    elif ref_vector[2] != 0:
+        offsets = mid_point_difs[:, 0]
+    else:
+        return None, None
+
+    def closest(mask):
+        if not mask.any():
+            return None
+        rows = np.flatnonzero(mask)
+        return member_ids[rows[np.argmin(distances[rows])]]
+
+    return closest(candidates & (offsets > 0)), closest(candidates & (offsets < 0))
+
+
+# Open Concrete Capacity Excels by path, as (app, sheet, solve macro, bar layers 3 to 5)
+_capacity_workbooks = {}
+# Function that puts back the calculation mode and quits the Excel instance, for each open Concrete Capacity Excel
+_capacity_quits = {}
+# Input values last written to each open Concrete Capacity Excel, by path then range address
+_capacity_inputs = {}
+
+
+def load_capacity_workbook(path):
+    """
+    Open the Concrete Capacity Excel once, in its own hidden Excel instance, and keep it for every
+    calculate_utilisation call. The instance is quit by close_capacity_workbooks, or at exit.
+    :return: (app, sheet, solve macro, (top, bottom) spacings of bar layers 3 to 5 as the workbook was opened)
+    """
+    if path not in _capacity_workbooks:
+        app = xw.App(visible=False, add_book=False)
+        app.display_alerts = False
+        app.screen_updating = False
+        try:
+            workbook = app.books.open(path)
+        except BaseException:
+            app.quit()
+            raise
+        # Excel only accepts a calculation mode once a workbook is open. Only recalculate when asked, rather than
+        # after every input write, and put the previous mode back when the instance is quit
+        quit_app = partial(_quit_capacity_app, app, app.calculation)
+        atexit.register(quit_app)
+        _capacity_quits[path] = quit_app
+        app.calculation = "manual"
+        sheet = workbook.sheets[0]
+        # Layers 3 to 5 (K29:K31 top, K36:K38 bottom) aren't inputs, so keep what the workbook came with
+        bar_column = sheet["K27:K38"].value
+        outer_layers = (list(bar_column[2:5]), list(bar_column[9:12]))
+        _capacity_workbooks[path] = (app, sheet, workbook.macro("Solvefordn"), outer_layers)
+        _capacity_inputs[path] = {}
+    return _capacity_workbooks[path]
+
+
+def close_capacity_workbooks():
+    """
+    Quit the Excel instances opened by load_capacity_workbook.
+    """
+    while _capacity_workbooks:
+        path, _ = _capacity_workbooks.popitem()
+        quit_app = _capacity_quits.pop(path)
+        atexit.unregister(quit_app)
+        quit_app()
+    _capacity_inputs.clear()
 
 
-def calculate_utilisation(depth, width, top_bar_1, top_bar_spacing_1, top_bar_spacing_2, btm_bar_1, btm_bar_spacing_1,
-                          btm_bar_spacing_2, Fx, Fy, Fz, Mx, My, Mz):
-    print("Extracting forces and calculating capacities")
+def _quit_capacity_app(app, calculation):
+    # Calculation mode is an application setting Excel can carry into the next session, so put it back
+    app.calculation = calculation
+    app.quit()
 
-    # Import the Concrete Capacity Excel
-    workbook = xw.Book("RC Beam Design to AS3600 - 2018.xlsm", visible=False)
-    sheet = workbook.sheets[0]
 
-    # Change BAR SIZES
-    sheet["D15"].value = top_bar_1
-    sheet["D16"].value = btm_bar_1
+def calculate_utilisation(depth, width, top_bar_1, top_bar_spacing_1, top_bar_spacing_2, btm_bar_1, btm_bar_spacing_1,
+                          btm_bar_spacing_2, Fx, Fy, Fz, Mx, My, Mz, capacity_path=capacity_spreadsheet):
+    print("Extracting forces and calculating capacities")
 
-    # Change BAR SPACING
-    sheet["K27"].value = top_bar_spacing_1
-    sheet["K28"].value = top_bar_spacing_2
-    sheet["K34"].value = btm_bar_spacing_1
-    sheet["K35"].value = btm_bar_spacing_2
+    # Import the Concrete Capacity Excel, opened on the first call only
+    app, sheet, solve, (top_outer_layers, btm_outer_layers) = load_capacity_workbook(capacity_path)
 
+    # Every sheet access is a round trip to Excel, so cells are read and written a whole block at a time.
     # Hold bar information
-    top_bar = sheet["D15"].value
-    btm_bar = sheet["D16"].value
-
-    top_bar_cells = ["K27", "K28", "K29", "K30", "K31"]
-    btm_bar_cells = ["K34", "K35", "K36", "K37", "K38"]
-
-    top_bar_amount = [sheet["K27"].value, sheet["K28"].value, sheet["K29"].value, sheet["K30"].value,
-                      sheet["K31"].value]
-    btm_bar_amount = [sheet["K34"].value, sheet["K35"].value, sheet["K36"].value, sheet["K37"].value,
-                      sheet["K38"].value]
+    top_bar = top_bar_1
+    btm_bar = btm_bar_1
+    top_bar_amount = [top_bar_spacing_1, top_bar_spacing_2] + top_outer_layers
+    btm_bar_amount = [btm_bar_spacing_1, btm_bar_spacing_2] + btm_outer_layers
 
-    # Flip the size of bars
+    # Flip the size and number of bars for negative moments. This is done here rather than in the sheet, and every
+    # call writes the full bar layout, so there is nothing to unflip afterwards
     if Mz < 0:
-        sheet["D15"].value = btm_bar
-        sheet["D16"].value = top_bar
+        top_bar, btm_bar = btm_bar, top_bar
+        top_bar_amount, btm_bar_amount = btm_bar_amount, top_bar_amount
+
+    inputs = {
+        # Change SECTION PROPERTIES
+        "D8:D9": [[depth], [width]],
+        # Bar sizes, then the five top and bottom bar spacings
+        "D15:D16": [[top_bar], [btm_bar]],
+        "K27:K31": [[amount] for amount in top_bar_amount],
+        "K34:K38": [[amount] for amount in btm_bar_amount],
+        # Ultimate bending (D33), then axial (D35), shear (D36), torsion (D37) and serviceability bending (D38).
+        # D34 is left alone so it is written separately
+        "D33": abs(Mz),
+        "D35:D38": [[abs(Fx)], [abs(Fz)], [abs(Mx)], [abs(Mz)]],
+    }
+
+    # The workbook stays open between calls, so only write the blocks that differ from the last call, e.g. the section
+    # and bars only change between master Excel rows or when the moment changes sign
+    written = _capacity_inputs[capacity_path]
+    for address, values in inputs.items():
+        if written.get(address) != values:
+            sheet[address].value = values
+            written[address] = values
+
+    # Recalculate once now that all inputs are in place, then run macro in workbook. Solver only changes its target
+    # cell, so with calculation on manual the results are recalculated again before they are read
+    app.calculate()
+    solve()
+    app.calculate()
+
+    # Grab values from the Excel, J8 and L8 are the first row and J19 and L19 the last row of J8:L19
+    results = sheet["J8:L19"].value
+    ultimate_strength, ultimate_utilisation = results[0][0], results[0][2]
+    serviceability_btm_stress, serviceability_utilisation = results[11][0], results[11][2]
 
-        # Flip the number of bars
-        for i, amount in zip(top_bar_cells, range(0, 5)):
-            sheet[i].value = btm_bar_amount[amount]
-
-        for i, amount in zip(btm_bar_cells, range(0, 5)):
-            sheet[i].value = top_bar_amount[amount]
+    return ultimate_utilisation, ultimate_strength, serviceability_btm_stress, serviceability_utilisation
 
-    # Change the values in the capacity Excel for ultimate positive and negative bending moments
-    sheet["D33"].value = abs(Mz)
 
-    # Change the values in the capacity Excel for serviceability positive and negative bending moments
-    sheet["D38"].value = abs(Mz)
+def calculate_utilisations(jobs, workers=1):
+    """
+    Run calculate_utilisation for each tuple of arguments in jobs, returning the results in the same order.
+    :param workers: with more than one, the jobs are shared between that many processes, each driving its own
+        Excel instance and its own copy of the capacity Excel, as the solve macro runs one case at a time per instance
+    """
+    # The max and min of different force columns often land on the same row, so only solve each distinct job once
+    unique_jobs = list(dict.fromkeys(jobs))
 
-    # Change the value in the capacity Excel for axial forces
-    sheet["D35"].value = abs(Fx)
+    if workers <= 1 or len(unique_jobs) <= 1:
+        unique_results = [calculate_utilisation(*job) for job in unique_jobs]
+    else:
+        workers = min(workers, len(unique_jobs))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_capacity_worker,
+                                 initargs=(capacity_spreadsheet,)) as executor:
+            unique_results = list(executor.map(_calculate_utilisation_job, unique_jobs,
+                                               chunksize=-(-len(unique_jobs) // workers)))
 
-    # Change the value in the capacity Excel for shear forces
-    sheet["D36"].value = abs(Fz)
+    results = dict(zip(unique_jobs, unique_results))
+    return [results[job] for job in jobs]
 
-    # Change the value in the capacity Excel for torsion forces
-    sheet["D37"].value = abs(Mx)
 
-    # Change SECTION PROPERTIES
-    sheet["D8"].value = depth
-    sheet["D9"].value = width
+# Path of the worker process's own copy of the capacity Excel, set by _init_capacity_worker
+_worker_capacity_path = None
 
-    # Run macro in workbook
-    workbook.macro("Solvefordn")()
 
-    # Grab values from the Excel
-    ultimate_utilisation = sheet["L8"].value
-    ultimate_strength = sheet["J8"].value
-    serviceability_btm_stress = sheet["J19"].value
-    serviceability_utilisation = sheet["L19"].value
+def _init_capacity_worker(path):
+    global _worker_capacity_path
+    # Excel won't open the same workbook twice, so every worker opens its own copy
+    copy_dir = tempfile.mkdtemp(prefix="capacity_")
+    _worker_capacity_path = shutil.copy2(path, copy_dir)
 
-    # Unflip the bars
-    sheet["D15"].value = top_bar
-    sheet["D16"].value = btm_bar
+    def cleanup():
+        # Excel has to let go of the copy before it can be deleted
+        close_capacity_workbooks()
+        shutil.rmtree(copy_dir, ignore_errors=True)
 
-    for i, amount in zip(top_bar_cells, range(0, 5)):
-        sheet[i].value = top_bar_amount[amount]
+    atexit.register(cleanup)
 
-    for i, amount in zip(btm_bar_cells, range(0, 5)):
-        sheet[i].value = btm_bar_amount[amount]
 
-    return ultimate_utilisation, ultimate_strength, serviceability_btm_stress, serviceability_utilisation
+def _calculate_utilisation_job(job):
+    return calculate_utilisation(*job, capacity_path=_worker_capacity_path)
 
 
 if __name__ == "__main__":
@@ -5,12 +5,15 @@ A class for parsing and interacting with SPACEGASS structural analysis output fi
 """
 
 import csv
+import itertools
 import re
 import warnings
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -57,8 +60,13 @@ class SGResults:
         'SECTIONS': 4,    # 1 main + 3 continuation lines
     }
 
-    # Pre-compiled regex for restraint code validation (performance optimization)
-    _RESTRAINT_CODE_PATTERN = re.compile(r'^[VRF]{6}$')
+    # Every valid restraint code: 6 characters of V, R or F (e.g. VRVRRR, VFVRRR)
+    _RESTRAINT_CODES = frozenset(map(''.join, itertools.product('VRF', repeat=6)))
+
+    # Lines that could be a section header or END: starting with a capital
+    # letter and without commas. Anchored on the newline before the line,
+    # which re finds much faster than a multiline '^'
+    _HEADER_CANDIDATE_PATTERN = re.compile(r'\n[^\S\n]*([A-Z][^\n,]*)')
 
     # -------------------------------------------------------------------------
     # Column name mappings for each section
@@ -125,8 +133,16 @@ class SGResults:
         self.filepath = Path(filepath)
         self._units: Dict[str, str] = {}
         self._dataframes: Dict[str, pd.DataFrame] = {}
-
-        # Parse the file
+        # Unparsed section text keyed by attribute name, in file order
+        self._raw_sections: Dict[str, Tuple[str, str]] = {}
+        self._section_order: List[str] = []
+        # Row positions by load case / member id for query_forces_moments
+        self._forces_index: Dict[str, Tuple[pd.DataFrame, Dict]] = {}
+        # Members joined with sections for query_member_sections, with the tables used
+        self._member_sections: Optional[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]] = None
+        self._member_ids: Optional[Tuple[pd.DataFrame, frozenset]] = None
+
+        # Split the file into sections; each is parsed on first access
         self._parse_file()
 
     @property
@@ -140,91 +156,91 @@ class SGResults:
 
     @property
     def filters(self) -> pd.DataFrame:
-        return self._dataframes.get('filters', pd.DataFrame())
+        return self._get_dataframe('filters')
 
     @property
     def nodes(self) -> pd.DataFrame:
-        return self._dataframes.get('nodes', pd.DataFrame())
+        return self._get_dataframe('nodes')
 
     @property
     def members(self) -> pd.DataFrame:
-        return self._dataframes.get('members', pd.DataFrame())
+        return self._get_dataframe('members')
 
     @property
     def restraints(self) -> pd.DataFrame:
-        return self._dataframes.get('restraints', pd.DataFrame())
+        return self._get_dataframe('restraints')
 
     @property
     def sections(self) -> pd.DataFrame:
-        return self._dataframes.get('sections', pd.DataFrame())
+        return self._get_dataframe('sections')
 
     @property
     def plates(self) -> pd.DataFrame:
-        return self._dataframes.get('plates', pd.DataFrame())
+        return self._get_dataframe('plates')
 
     @property
     def materials(self) -> pd.DataFrame:
-        return self._dataframes.get('materials', pd.DataFrame())
+        return self._get_dataframe('materials')
 
     @property
     def node_loads(self) -> pd.DataFrame:
-        return self._dataframes.get('node_loads', pd.DataFrame())
+        return self._get_dataframe('node_loads')
 
     @property
     def member_forces(self) -> pd.DataFrame:
-        return self._dataframes.get('member_forces', pd.DataFrame())
+        return self._get_dataframe('member_forces')
 
     @property
     def self_weight(self) -> pd.DataFrame:
-        return self._dataframes.get('self_weight', pd.DataFrame())
+        return self._get_dataframe('self_weight')
 
     @property
     def harmonic_loads(self) -> pd.DataFrame:
-        return self._dataframes.get('harmonic_loads', pd.DataFrame())
+        return self._get_dataframe('harmonic_loads')
 
     @property
     def combinations(self) -> pd.DataFrame:
-        return self._dataframes.get('combinations', pd.DataFrame())
+        return self._get_dataframe('combinations')
 
     @property
     def titles(self) -> pd.DataFrame:
-        return self._dataframes.get('titles', pd.DataFrame())
+        return self._get_dataframe('titles')
 
     @property
     def load_case_groups(self) -> pd.DataFrame:
-        return self._dataframes.get('load_case_groups', pd.DataFrame())
+        return self._get_dataframe('load_case_groups')
 
     @property
     def load_categories(self) -> pd.DataFrame:
-        return self._dataframes.get('load_categories', pd.DataFrame())
+        return self._get_dataframe('load_categories')
 
     @property
     def displacements(self) -> pd.DataFrame:
-        return self._dataframes.get('displacements', pd.DataFrame())
+        return self._get_dataframe('displacements')
 
     @property
     def member_forces_moments(self) -> pd.DataFrame:
-        return self._dataframes.get('member_forces_moments', pd.DataFrame())
+        return self._get_dataframe('member_forces_moments')
 
     @property
     def reactions(self) -> pd.DataFrame:
-        return self._dataframes.get('reactions', pd.DataFrame())
+        return self._get_dataframe('reactions')
 
     @property
     def member_int_displacements(self) -> pd.DataFrame:
-        return self._dataframes.get('member_int_displacements', pd.DataFrame())
+        return self._get_dataframe('member_int_displacements')
 
     @property
     def member_int_forces_moments(self) -> pd.DataFrame:
-        return self._dataframes.get('member_int_forces_moments', pd.DataFrame())
+        return self._get_dataframe('member_int_forces_moments')
 
     @property
     def member_stresses(self) -> pd.DataFrame:
-        return self._dataframes.get('member_stresses', pd.DataFrame())
+        return self._get_dataframe('member_stresses')
 
     @property
     def steel_members(self) -> pd.DataFrame:
-        return self._dataframes.get('steel_members', pd.DataFrame())
+        return self._get_dataframe('steel_members')
 
     # -------------------------------------------------------------------------
     # Query methods
@@ -243,31 +259,43 @@ class SGResults:
             member_id: Single member ID or list of IDs to filter by.
 
         Returns:
-            DataFrame filtered by the specified criteria. Returns all data
-            if no filters are provided.
+            DataFrame filtered by the specified criteria. Returns a copy of
+            all data if no filters are provided, so the cached table is never
+            handed out.
         """
         df = self.member_forces_moments
 
-        if df.empty:
-            return df
-
-        # Build filter mask
-        mask = pd.Series(True, index=df.index)
+        if df.empty or (load_case_id is None and member_id is None):
+            return df.copy()
 
-        if load_case_id is not None:
-            if isinstance(load_case_id, int):
-                mask &= df['load_case_id'] == load_case_id
-            else:
-                mask &= df['load_case_id'].isin(load_case_id)
+        # Mark the rows of each requested id, looked up from the grouped row
+        # positions rather than comparing every row, only for the filters given
+        mask = None
 
-        if member_id is not None:
-            if isinstance(member_id, int):
-                mask &= df['member_id'] == member_id
-            else:
-                mask &= df['member_id'].isin(member_id)
+        for column, ids in (('load_case_id', load_case_id), ('member_id', member_id)):
+            if ids is None:
+                continue
+            row_positions = self._forces_positions(df, column)
+            if isinstance(ids, int):
+                ids = [ids]
+            column_mask = np.zeros(len(df), dtype=bool)
+            for i in ids:
+                if i in row_positions:
+                    column_mask[row_positions[i]] = True
+            mask = column_mask if mask is None else mask & column_mask
 
         return df[mask]
 
+    def _forces_positions(self, df: pd.DataFrame, column: str) -> Dict:
+        """
+        Row positions of each value of a member forces column, grouped once per DataFrame.
+        """
+        cached = self._forces_index.get(column)
+        if cached is None or cached[0] is not df:
+            cached = (df, df.groupby(column, sort=False).indices)
+            self._forces_index[column] = cached
+        return cached[1]
+
     def query_member_sections(
         self,
         member_id: Optional[Union[int, List[int]]] = None,
@@ -282,6 +310,7 @@ class SGResults:
         Returns:
             DataFrame with member info joined with section properties.
             All columns from both members and sections tables are included.
+            Always a new DataFrame, safe to modify without affecting later queries.
             Returns empty DataFrame if no members exist.
 
         Warns:
@@ -315,7 +344,7 @@ class SGResults:
                 member_ids = list(member_id)
 
             # Check for invalid member IDs and warn
-            valid_ids = set(members_df['member_id'])
+            valid_ids = self._member_id_set(members_df)
             requested_ids = set(member_ids)
             invalid_ids = requested_ids - valid_ids
 
@@ -326,78 +355,61 @@ class SGResults:
                     stacklevel=2,
                 )
 
-            # Filter to requested members
-            members_df = members_df[members_df['member_id'].isin(member_ids)]
-
             # Return empty if no valid members
-            if members_df.empty:
+            if not requested_ids & valid_ids:
                 return pd.DataFrame()
 
         # Return members only if no sections exist
         if sections_df.empty:
-            return members_df
-
-        # Join members with sections on section_id
-        result = members_df.merge(
-            sections_df,
-            on='section_id',
-            how='left',
-            suffixes=('', '_section'),
-        )
+            if member_id is None:
+                return members_df.copy()
+            return members_df[members_df['member_id'].isin(member_ids)]
+
+        result = self._member_sections_join(members_df, sections_df)
+        if member_id is None:
+            return result.copy()
 
-        return result
+        # A left join keeps the members' order, so this matches joining only the requested rows
+        return result[result['member_id'].isin(member_ids)].reset_index(drop=True)
+
+    def _member_id_set(self, members_df: pd.DataFrame) -> frozenset:
+        """
+        Set of the member ids in the members table, built once per DataFrame.
+        """
+        cached = self._member_ids
+        if cached is None or cached[0] is not members_df:
+            cached = (members_df, frozenset(members_df['member_id'].tolist()))
+            self._member_ids = cached
+        return cached[1]
+
+    def _member_sections_join(
+        self, members_df: pd.DataFrame, sections_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Members joined with sections on section_id, joined once per pair of tables.
+        """
+        cached = self._member_sections
+        if cached is None or cached[0] is not members_df or cached[1] is not sections_df:
+            joined = members_df.merge(
+                sections_df,
+                on='section_id',
+                how='left',
+                suffixes=('', '_section'),
+            )
+            cached = (members_df, sections_df, joined)
+            self._member_sections = cached
+        return cached[2]
 
     # -------------------------------------------------------------------------
     # Parsing methods
     # -------------------------------------------------------------------------
 
     def _parse_file(self) -> None:
-        """Parse the entire SPACEGASS output file."""
-        # Use streaming approach to avoid loading entire file into memory
-        raw_sections: Dict[str, List[str]] = {}
-        current_section: Optional[str] = None
-        current_lines: List[str] = []
-        units_parsed = False
-
-        # Use set for O(1) header lookup
-        section_headers_set = set(self.SECTION_MAP.keys())
-
+        """Split the SPACEGASS output file into its sections."""
         try:
             with open(self.filepath, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f):
-                    stripped = line.strip()
-
-                    # Parse units from early in the file (usually line 14)
-                    if not units_parsed and line_num < 20:
-                        if stripped.startswith('UNITS '):
-                            self._parse_units_line(stripped)
-                            units_parsed = True
-                            continue
-
-                    # Skip empty lines and comments
-                    if not stripped or stripped.startswith('#'):
-                        continue
-
-                    # Check if this line is a section header
-                    if stripped in section_headers_set:
-                        # Save previous section
-                        if current_section is not None:
-                            raw_sections[current_section] = current_lines
-                        # Start new section
-                        current_section = stripped
-                        current_lines = []
-                        continue
-
-                    # Check for END marker
-                    if stripped == 'END':
-                        if current_section is not None:
-                            raw_sections[current_section] = current_lines
-                        break
-
-                    # Add to current section
-                    if current_section is not None:
-                        current_lines.append(line)
-
+                # Leading newline so a header on the first line is found too
+                text = '\n' + f.read()
         except FileNotFoundError:
             raise FileNotFoundError(f"SPACEGASS output file not found: {self.filepath}")
         except PermissionError:
@@ -405,23 +417,60 @@ class SGResults:
         except UnicodeDecodeError as e:
             raise ValueError(f"File contains invalid UTF-8 encoding: {self.filepath}") from e
 
-        # Parse each section into a DataFrame
-        for section_name, section_lines in raw_sections.items():
-            attr_name = self.SECTION_MAP.get(section_name)
-            if attr_name and section_lines:
-                df = self._parse_section(section_name, section_lines)
-                self._dataframes[attr_name] = df
+        # Parse units from early in the file (usually line 14)
+        for line in text.split('\n', 21)[1:21]:
+            stripped = line.strip()
+            if stripped.startswith('UNITS '):
+                self._parse_units_line(stripped)
+                break
+
+        # Each section runs from its header line to the next header, or END
+        headers = [
+            match for match in self._HEADER_CANDIDATE_PATTERN.finditer(text)
+            if match.group(1).strip() in self.SECTION_MAP or match.group(1).strip() == 'END'
+        ]
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            section_name = header.group(1).strip()
+            if section_name == 'END':
+                break
+            section_end = next_header.start() if next_header else len(text)
+            attr_name = self.SECTION_MAP[section_name]
+            # A repeated section replaces the earlier one, keeping its place
+            if attr_name not in self._raw_sections:
+                self._section_order.append(attr_name)
+            self._raw_sections[attr_name] = (section_name, text[header.end():section_end])
+
+    @staticmethod
+    def _section_lines(block: str) -> List[str]:
+        """Content lines of a section, skipping empty lines and comments."""
+        return [
+            line for line in block.split('\n')
+            if (stripped := line.strip()) and not stripped.startswith('#')
+        ]
+
+    def _get_dataframe(self, attr_name: str) -> pd.DataFrame:
+        """Return a section's DataFrame, parsing it on first access."""
+        df = self._dataframes.get(attr_name)
+        if df is None:
+            raw = self._raw_sections.pop(attr_name, None)
+            if raw is None:
+                # Missing sections get their own empty DataFrame, kept like any other
+                df = pd.DataFrame()
+            else:
+                section_name, block = raw
+                df = self._parse_section(section_name, self._section_lines(block))
+            self._dataframes[attr_name] = df
+        return df
 
     def _parse_units_line(self, line: str) -> None:
         """Parse a UNITS line into the units dictionary."""
         # Format: "UNITS LENGTH:m, SECTION:mm, STRENGTH:MPa, ..."
         units_str = line[6:]  # Remove "UNITS "
-        pairs = units_str.split(',')
-        for pair in pairs:
-            pair = pair.strip()
-            if ':' in pair:
-                key, value = pair.split(':', 1)
-                self._units[key.strip()] = value.strip()
+        self._units.update(
+            (key.strip(), value.strip())
+            for key, sep, value in (pair.partition(':') for pair in units_str.split(','))
+            if sep
+        )
 
     def _get_column_names(self, section_name: str, num_cols: int) -> List[str]:
         """
@@ -434,15 +483,8 @@ class SGResults:
         Returns:
             List of column names, using defined names first then placeholders
         """
-        defined_names = self.SECTION_COLUMNS.get(section_name, [])
-        columns = []
-
-        for i in range(num_cols):
-            if i < len(defined_names):
-                columns.append(defined_names[i])
-            else:
-                columns.append(f'col_{i}')
-
+        columns = self.SECTION_COLUMNS.get(section_name, [])[:num_cols]
+        columns.extend(f'col_{i}' for i in range(len(columns), num_cols))
         return columns
 
     def _parse_section(self, section_name: str, lines: List[str]) -> pd.DataFrame:
@@ -466,28 +508,53 @@ class SGResults:
         if not lines:
             return pd.DataFrame()
 
+        df = self._read_numeric_section(section_name, lines)
+        if df is not None:
+            return df
+
         rows = []
-        max_cols = 0
 
         for line in lines:
             parsed = self._parse_csv_line(line)
             if parsed:
                 rows.append(parsed)
-                max_cols = max(max_cols, len(parsed))
 
         if not rows:
             return pd.DataFrame()
 
-        # Pad rows to have consistent column count
-        for row in rows:
-            row.extend([None] * (max_cols - len(row)))
+        return self._build_dataframe(section_name, rows)
 
-        # Create DataFrame with column names (defined or placeholder)
-        columns = self._get_column_names(section_name, max_cols)
-        df = pd.DataFrame(rows, columns=columns)
+    def _read_numeric_section(self, section_name: str, lines: List[str]) -> Optional[pd.DataFrame]:
+        """
+        Read a purely numeric section in one pass with pandas' C parser.
 
-        # Try to convert numeric columns
-        return self._convert_numeric_columns(df)
+        Returns None, so the caller falls back to line-by-line parsing, if the
+        section has quoted fields, blanks or any non-numeric column.
+        """
+        text = '\n'.join(lines)
+        if '"' in text:
+            return None
+
+        num_cols = max(line.count(',') for line in lines) + 1
+        try:
+            df = pd.read_csv(
+                StringIO(text),
+                header=None,
+                names=range(num_cols),
+                skipinitialspace=True,
+                na_filter=False,
+                float_precision='round_trip',
+            )
+        except (ValueError, pd.errors.ParserError):
+            return None
+
+        if df.empty or any(dtype not in (np.int64, np.float64) for dtype in df.dtypes):
+            return None
+        if df.select_dtypes(np.float64).isna().any().any():
+            return None
+
+        df.columns = self._get_column_names(section_name, num_cols)
+        return df
 
     def _parse_multiline_section(self, section_name: str, lines: List[str]) -> pd.DataFrame:
         """Parse a section where each record spans multiple lines."""
@@ -497,7 +564,6 @@ class SGResults:
         lines_per_record = self.MULTILINE_SECTIONS[section_name]
 
         rows = []
-        max_cols = 0
         i = 0
 
         while i < len(lines):
@@ -518,7 +584,7 @@ class SGResults:
 
             # For RESTRAINTS: verify this is a main record by checking for restraint code
             if section_name == 'RESTRAINTS':
-                if len(main_parsed) < 2 or not self._is_restraint_code(main_parsed[1]):
+                if len(main_parsed) < 2 or main_parsed[1] not in self._RESTRAINT_CODES:
                     # This is not a main record, skip this line
                     i += 1
                     continue
@@ -538,29 +604,12 @@ class SGResults:
                     row.extend(cont_parsed)
 
             rows.append(row)
-            max_cols = max(max_cols, len(row))
             i += lines_per_record
 
         if not rows:
             return pd.DataFrame()
 
-        # Pad rows to have consistent column count
-        for row in rows:
-            row.extend([None] * (max_cols - len(row)))
-
-        # Create DataFrame with column names (defined or placeholder)
-        columns = self._get_column_names(section_name, max_cols)
-        df = pd.DataFrame(rows, columns=columns)
-
-        # Try to convert numeric columns
-        return self._convert_numeric_columns(df)
-
-    def _is_restraint_code(self, value) -> bool:
-        """Check if a value is a valid restraint code (e.g., VRVRRR, VFVRRR)."""
-        if not isinstance(value, str):
-            return False
-        # Restraint codes are 6 characters containing V, R, or F
-        return bool(self._RESTRAINT_CODE_PATTERN.match(value.strip()))
+        return self._build_dataframe(section_name, rows)
 
     def _parse_csv_line(self, line: str) -> Optional[List]:
         """
@@ -580,42 +629,67 @@ class SGResults:
                 return cleaned if cleaned else None
 
             # Slow path: has quotes - use csv module to handle properly
-            reader = csv.reader(StringIO(line))
-            row = next(reader)
+            row = next(csv.reader((line,)))
             cleaned = [val.strip() or None for val in row]
             return cleaned if cleaned else None
         except (csv.Error, StopIteration):
             return None
 
-    def _convert_numeric_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _build_dataframe(self, section_name: str, rows: List[List]) -> pd.DataFrame:
         """
-        Try to convert columns to numeric types where possible.
+        Build a section's DataFrame from parsed rows, converting numeric columns.
 
-        This improves memory usage and enables numeric operations.
+        The rows are transposed once, padding short rows with None, and each
+        column converted on its own, so the DataFrame is only constructed once.
         """
-        if df.empty:
-            return df
+        converted = {
+            i: self._convert_numeric_column(values)
+            for i, values in enumerate(itertools.zip_longest(*rows))
+        }
+        df = pd.DataFrame(converted)
+        df.columns = self._get_column_names(section_name, len(converted))
+        return df
+
+    # Characters that NumPy accepts in numbers but pd.to_numeric does not
+    # (underscores) or that spell nan/inf, which need the null-count check
+    _SLOW_NUMERIC_CHARS = frozenset('_nNiI')
+
+    def _convert_numeric_column(self, values: Tuple) -> Union[np.ndarray, List]:
+        """
+        Convert a column of parsed strings to numbers if most values are numeric.
 
-        # Build converted columns dict to avoid repeated DataFrame copies
-        converted_cols = {}
-        for col in df.columns:
-            try:
-                numeric_col = pd.to_numeric(df[col], errors='coerce')
-                # Only convert if most values are numeric (>50%)
-                non_null_count = numeric_col.notna().sum()
-                original_non_null = df[col].notna().sum()
-                if original_non_null > 0 and non_null_count / original_non_null > 0.5:
-                    converted_cols[col] = numeric_col
-                else:
-                    converted_cols[col] = df[col]
-            except (TypeError, ValueError):
-                converted_cols[col] = df[col]
-
-        return pd.DataFrame(converted_cols)
+        Columns of plain integers or floats with no blanks are converted by
+        NumPy directly; anything else falls back to pd.to_numeric, keeping the
+        column as strings unless more than 50% of its values are numeric.
+        """
+        if None not in values:
+            joined = ''.join(values)
+            if self._SLOW_NUMERIC_CHARS.isdisjoint(joined):
+                try:
+                    return np.array(values, dtype=np.int64)
+                except OverflowError:
+                    pass
+                except ValueError:
+                    try:
+                        return np.array(values, dtype=np.float64)
+                    except ValueError:
+                        pass
+
+        original_non_null = len(values) - values.count(None)
+        if original_non_null == 0:
+            return list(values)
+
+        numeric_col = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce')
+        # Only convert if most values are numeric (>50%)
+        if numeric_col.notna().sum() / original_non_null > 0.5:
+            return numeric_col.to_numpy()
+        return list(values)
 
     def __repr__(self) -> str:
         """Return a string representation of the SGResults object."""
-        sections_loaded = [name for name, df in self._dataframes.items() if not df.empty]
+        sections_loaded = [
+            name for name in self._section_order if not self._get_dataframe(name).empty
+        ]
         return f"SGResults(filepath='{self.filepath}', sections={sections_loaded})"
 
     def summary(self) -> str:
@@ -626,10 +700,37 @@ class SGResults:
         lines.append("Sections:")
 
         for section_name, attr_name in sorted(self.SECTION_MAP.items(), key=lambda x: x[1]):
-            df = self._dataframes.get(attr_name, pd.DataFrame())
+            df = self._get_dataframe(attr_name)
             if not df.empty:
                 lines.append(f"  {attr_name}: {len(df)} rows x {len(df.columns)} cols")
             else:
                 lines.append(f"  {attr_name}: (empty)")
 
         return "\n".join(lines)
+
+
+def load_results(filepath: str) -> SGResults:
+    """
+    Load a SPACEGASS output file, reusing the parsed results until the file changes.
+
+    Results are cached on the resolved path and modification time, so the same
+    SGResults instance is returned for repeated calls on an unchanged file and
+    callers must not modify its DataFrames. A re-exported file is parsed again.
+
+    Args:
+        filepath: Path to the SPACEGASS text output file.
+
+    Returns:
+        SGResults for the file.
+    """
+    path = Path(filepath).resolve()
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"SPACEGASS output file not found: {path}")
+    return _load_results(str(path), mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_results(path: str, mtime_ns: int) -> SGResults:
+    return SGResults(path)
@@ -1,38 +1,68 @@
-"""Pytest configuration and fixtures for sg_results tests."""
+"""Pytest configuration and fixtures for sg_results and concrete_capacity tests."""
 
 import sys
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from sg_results import SGResults
+from concrete_capacity import (
+    AppliedLoads,
+    ConcreteCapacityAnalyser,
+    ConcreteProperties,
+    ReinforcementLayer,
+    SectionGeometry,
+)
+from sg_results import SGResults, load_results
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SPREADSHEET_PATH = Path(__file__).parent.parent / "src" / "RC Beam Design to AS3600 - 2018.xlsm"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_file_path() -> Path:
     """Path to minimal test fixture file."""
     return FIXTURES_DIR / "minimal_sg_output.txt"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_file_path() -> Path:
     """Path to full example fixture file."""
     return FIXTURES_DIR / "example_sg_output.txt"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_results(minimal_file_path: Path) -> SGResults:
-    """SGResults instance loaded from minimal fixture."""
-    return SGResults(str(minimal_file_path))
+    """SGResults instance loaded from minimal fixture, shared so tests must not modify it."""
+    return load_results(str(minimal_file_path))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_results(example_file_path: Path) -> SGResults:
-    """SGResults instance loaded from full example fixture."""
-    return SGResults(str(example_file_path))
+    """SGResults instance loaded from full example fixture, shared so tests must not modify it."""
+    return load_results(str(example_file_path))
+
+
+@pytest.fixture(scope="session")
+def analyser() -> Iterator[ConcreteCapacityAnalyser]:
+    """Analyser on the real spreadsheet, opened once and shared by every integration test."""
+    if not SPREADSHEET_PATH.exists():
+        pytest.skip("Spreadsheet not found for integration tests")
+    with ConcreteCapacityAnalyser(spreadsheet_path=SPREADSHEET_PATH) as analyser:
+        yield analyser
+
+
+@pytest.fixture(scope="session")
+def typical_inputs() -> dict:
+    """Typical input values for the integration tests."""
+    return {
+        "geometry": SectionGeometry(depth=500, width=300),
+        "concrete": ConcreteProperties(strength=40),
+        "top_reo": ReinforcementLayer(bar_size=16, spacings=(200, 200)),
+        "bottom_reo": ReinforcementLayer(bar_size=20, spacings=(150, 150)),
+        "loads": AppliedLoads(mz=250, fx=50),
+    }
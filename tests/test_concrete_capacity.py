@@ -1,10 +1,16 @@
 """Tests for concrete_capacity module."""
 
+import subprocess
+import sys
+from itertools import groupby
 from pathlib import Path
+from types import SimpleNamespace
 
+import numpy as np
 import pandas as pd
 import pytest
 
+import concrete_capacity
 from concrete_capacity import (
     AppliedLoads,
     ConcreteCapacityAnalyser,
@@ -15,6 +21,9 @@ from concrete_capacity import (
     UtilisationResult,
     VALID_BAR_SIZES,
     MAX_REINFORCEMENT_LAYERS,
+    _column_letters,
+    _column_number,
+    _contiguous_runs,
 )
 
 
@@ -27,25 +36,20 @@ class TestSectionGeometry:
         assert geom.depth == 500
         assert geom.width == 300
 
-    def test_zero_depth_raises(self):
-        """Test that zero depth raises ValueError."""
-        with pytest.raises(ValueError, match="depth must be positive"):
-            SectionGeometry(depth=0, width=300)
-
-    def test_negative_depth_raises(self):
-        """Test that negative depth raises ValueError."""
-        with pytest.raises(ValueError, match="depth must be positive"):
-            SectionGeometry(depth=-100, width=300)
-
-    def test_zero_width_raises(self):
-        """Test that zero width raises ValueError."""
-        with pytest.raises(ValueError, match="width must be positive"):
-            SectionGeometry(depth=500, width=0)
-
-    def test_negative_width_raises(self):
-        """Test that negative width raises ValueError."""
-        with pytest.raises(ValueError, match="width must be positive"):
-            SectionGeometry(depth=500, width=-100)
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"depth": 0, "width": 300}, "depth must be positive"),
+            ({"depth": -100, "width": 300}, "depth must be positive"),
+            ({"depth": 500, "width": 0}, "width must be positive"),
+            ({"depth": 500, "width": -100}, "width must be positive"),
+        ],
+        ids=["zero_depth", "negative_depth", "zero_width", "negative_width"],
+    )
+    def test_invalid_geometry_raises(self, kwargs, match):
+        """Test that non-positive depth or width raises ValueError."""
+        with pytest.raises(ValueError, match=match):
+            SectionGeometry(**kwargs)
 
     def test_frozen(self):
         """Test that geometry is immutable."""
@@ -62,26 +66,25 @@ class TestConcreteProperties:
         concrete = ConcreteProperties(strength=40)
         assert concrete.strength == 40
 
-    def test_typical_strengths(self):
+    @pytest.mark.parametrize("strength", [25, 32, 40, 50, 65, 80])
+    def test_typical_strengths(self, strength):
         """Test common concrete strengths."""
-        for strength in [25, 32, 40, 50, 65, 80]:
-            concrete = ConcreteProperties(strength=strength)
-            assert concrete.strength == strength
-
-    def test_zero_strength_raises(self):
-        """Test that zero strength raises ValueError."""
-        with pytest.raises(ValueError, match="strength must be positive"):
-            ConcreteProperties(strength=0)
-
-    def test_negative_strength_raises(self):
-        """Test that negative strength raises ValueError."""
-        with pytest.raises(ValueError, match="strength must be positive"):
-            ConcreteProperties(strength=-40)
-
-    def test_excessive_strength_raises(self):
-        """Test that excessively high strength raises ValueError."""
-        with pytest.raises(ValueError, match="seems too high"):
-            ConcreteProperties(strength=150)
+        concrete = ConcreteProperties(strength=strength)
+        assert concrete.strength == strength
+
+    @pytest.mark.parametrize(
+        ("strength", "match"),
+        [
+            (0, "strength must be positive"),
+            (-40, "strength must be positive"),
+            (150, "seems too high"),
+        ],
+        ids=["zero", "negative", "excessive"],
+    )
+    def test_invalid_strength_raises(self, strength, match):
+        """Test that non-positive or excessively high strength raises ValueError."""
+        with pytest.raises(ValueError, match=match):
+            ConcreteProperties(strength=strength)
 
     def test_boundary_strength(self):
         """Test boundary value of 100 MPa."""
@@ -89,6 +92,15 @@ class TestConcreteProperties:
         assert concrete.strength == 100
 
 
+def _sample_spacings(seed: int = 0) -> list[tuple[int, ...]]:
+    """Random spacings of every allowed layer count, from a fixed seed so runs repeat."""
+    rng = np.random.default_rng(seed)
+    return [
+        tuple(int(s) for s in rng.integers(0, 501, size=count))
+        for count in range(MAX_REINFORCEMENT_LAYERS + 1)
+    ]
+
+
 class TestReinforcementLayer:
     """Tests for ReinforcementLayer dataclass."""
 
@@ -98,17 +110,34 @@ class TestReinforcementLayer:
         assert layer.bar_size == 20
         assert layer.spacings == (150, 200)
 
-    def test_all_valid_bar_sizes(self):
+    @pytest.mark.parametrize("size", sorted(VALID_BAR_SIZES))
+    def test_all_valid_bar_sizes(self, size):
         """Test all valid Australian bar sizes."""
-        for size in VALID_BAR_SIZES:
-            layer = ReinforcementLayer(bar_size=size, spacings=(150,))
-            assert layer.bar_size == size
+        layer = ReinforcementLayer(bar_size=size, spacings=(150,))
+        assert layer.bar_size == size
 
     def test_invalid_bar_size_raises(self):
         """Test that invalid bar size raises ValueError."""
         with pytest.raises(ValueError, match="bar_size must be one of"):
             ReinforcementLayer(bar_size=15, spacings=(150,))
 
+    def test_integral_float_bar_size(self):
+        """Test that an integral float bar size is accepted."""
+        layer = ReinforcementLayer(bar_size=20.0, spacings=(150,))
+        assert layer.bar_size == 20
+
+    @pytest.mark.parametrize("size", [20.5, -20, 44, "20", None])
+    def test_non_standard_bar_size_raises(self, size):
+        """Test that non-integral, out-of-range and non-numeric sizes raise."""
+        with pytest.raises(ValueError, match="bar_size must be one of"):
+            ReinforcementLayer(bar_size=size, spacings=(150,))
+
+    def test_list_spacings_stored_as_tuple(self):
+        """Test that list spacings are stored as a tuple."""
+        layer = ReinforcementLayer(bar_size=20, spacings=[150, 200])
+        assert layer.spacings == (150, 200)
+        assert layer == ReinforcementLayer(bar_size=20, spacings=(150, 200))
+
     def test_empty_spacings(self):
         """Test layer with no spacings."""
         layer = ReinforcementLayer(bar_size=20, spacings=())
@@ -121,13 +150,13 @@ class TestReinforcementLayer:
 
     def test_max_spacings(self):
         """Test layer with maximum allowed spacings."""
-        spacings = tuple([150] * MAX_REINFORCEMENT_LAYERS)
+        spacings = (150,) * MAX_REINFORCEMENT_LAYERS
         layer = ReinforcementLayer(bar_size=20, spacings=spacings)
         assert len(layer.spacings) == MAX_REINFORCEMENT_LAYERS
 
     def test_too_many_spacings_raises(self):
         """Test that too many spacings raises ValueError."""
-        spacings = tuple([150] * (MAX_REINFORCEMENT_LAYERS + 1))
+        spacings = (150,) * (MAX_REINFORCEMENT_LAYERS + 1)
         with pytest.raises(ValueError, match="maximum .* layers allowed"):
             ReinforcementLayer(bar_size=20, spacings=spacings)
 
@@ -141,6 +170,37 @@ class TestReinforcementLayer:
         layer = ReinforcementLayer(bar_size=20, spacings=(150, 0, 200))
         assert layer.spacings == (150, 0, 200)
 
+    @pytest.mark.parametrize("spacings", _sample_spacings())
+    @pytest.mark.parametrize("size", sorted(VALID_BAR_SIZES))
+    def test_layer_invariants(self, size, spacings):
+        """Test any valid bar size with any allowed number of non-negative spacings."""
+        layer = ReinforcementLayer(bar_size=size, spacings=spacings)
+        assert layer.bar_size == size
+        assert layer.spacings == spacings
+        assert len(layer.padded_spacings) == MAX_REINFORCEMENT_LAYERS
+        assert layer.padded_spacings[:len(spacings)] == spacings
+        assert ReinforcementLayer.unchecked(size, spacings) == layer
+
+    @pytest.mark.parametrize("position", range(MAX_REINFORCEMENT_LAYERS))
+    def test_negative_spacing_in_any_layer_raises(self, position):
+        """Test that a negative spacing raises ValueError whichever layer it is in."""
+        spacings = [150] * MAX_REINFORCEMENT_LAYERS
+        spacings[position] = -1
+        with pytest.raises(ValueError, match="must be non-negative"):
+            ReinforcementLayer(bar_size=20, spacings=tuple(spacings))
+
+    def test_padded_spacings(self):
+        """Test spacings are padded with zeros to the maximum layer count."""
+        layer = ReinforcementLayer(bar_size=20, spacings=(150, 200))
+        assert layer.padded_spacings == (150, 200) + (0,) * (MAX_REINFORCEMENT_LAYERS - 2)
+        assert layer == ReinforcementLayer(bar_size=20, spacings=(150, 200))
+
+    def test_unchecked_matches_validated(self):
+        """Test that unchecked construction gives an equal layer."""
+        layer = ReinforcementLayer.unchecked(20, (150, 200))
+        assert layer == ReinforcementLayer(bar_size=20, spacings=(150, 200))
+        assert layer.padded_spacings == ReinforcementLayer(20, (150, 200)).padded_spacings
+
     def test_from_spacings_factory(self):
         """Test from_spacings class method."""
         layer = ReinforcementLayer.from_spacings(20, 150, 200, 250)
@@ -190,32 +250,34 @@ class TestAppliedLoads:
         assert loads.mz == -250
         assert loads.fx == -50
 
-    def test_from_series_lowercase(self):
-        """Test creating loads from pandas Series with lowercase columns."""
-        series = pd.Series({
-            "fx": 10, "fy": 20, "fz": 30,
-            "mx": 40, "my": 50, "mz": 60
+    @pytest.mark.parametrize(
+        ("series_dict", "expected"),
+        [
+            (
+                {"fx": 10, "fy": 20, "fz": 30, "mx": 40, "my": 50, "mz": 60},
+                {"fx": 10, "mz": 60},
+            ),
+            (
+                {"Fx": 10, "Fy": 20, "Fz": 30, "Mx": 40, "My": 50, "Mz": 60},
+                {"fx": 10, "mz": 60},
+            ),
+            ({"mz": 100}, {"fx": 0.0, "mz": 100}),
+        ],
+        ids=["lowercase", "uppercase", "missing_columns"],
+    )
+    def test_from_series(self, series_dict, expected):
+        """Test creating loads from pandas Series; missing columns default to zero."""
+        loads = AppliedLoads.from_series(pd.Series(series_dict))
+        for name, value in expected.items():
+            assert getattr(loads, name) == value
+
+    def test_from_frame(self):
+        """Test creating loads for each row of a DataFrame."""
+        frame = pd.DataFrame({
+            "Fx": [10, -5], "Mz": [60, -80], "Load_Case": [1, 2],
         })
-        loads = AppliedLoads.from_series(series)
-        assert loads.fx == 10
-        assert loads.mz == 60
-
-    def test_from_series_uppercase(self):
-        """Test creating loads from pandas Series with uppercase columns."""
-        series = pd.Series({
-            "Fx": 10, "Fy": 20, "Fz": 30,
-            "Mx": 40, "My": 50, "Mz": 60
-        })
-        loads = AppliedLoads.from_series(series)
-        assert loads.fx == 10
-        assert loads.mz == 60
-
-    def test_from_series_missing_columns(self):
-        """Test that missing columns default to zero."""
-        series = pd.Series({"mz": 100})
-        loads = AppliedLoads.from_series(series)
-        assert loads.mz == 100
-        assert loads.fx == 0.0
+        loads = AppliedLoads.from_frame(frame)
+        assert loads == [AppliedLoads(fx=10, mz=60), AppliedLoads(fx=-5, mz=-80)]
 
 
 class TestUtilisationResult:
@@ -293,6 +355,149 @@ class TestSpreadsheetCells:
         assert cells.top_bar_size == "D15"
 
 
+class TestContiguousRuns:
+    """Tests for grouping cell writes into contiguous blocks."""
+
+    def test_default_load_cells(self):
+        """Test that the default load cells collapse into two blocks."""
+        values = {"D33": 1, "D35": 2, "D36": 3, "D37": 4, "D38": 5}
+        runs = list(_contiguous_runs(values))
+        assert runs == [("D33", "D33", [1]), ("D35", "D38", [2, 3, 4, 5])]
+
+    def test_unordered_columns(self):
+        """Test that cells are grouped per column and sorted by row."""
+        values = {"K28": 2, "D16": 20, "K27": 1, "D15": 16}
+        runs = sorted(_contiguous_runs(values))
+        assert runs == [("D15", "D16", [16, 20]), ("K27", "K28", [1, 2])]
+
+    def test_invalid_cell_raises(self):
+        """Test that a malformed cell reference raises ValueError."""
+        with pytest.raises(ValueError, match="invalid cell reference"):
+            list(_contiguous_runs({"not a cell": 1}))
+
+
+class TestColumnConversion:
+    """Tests for converting between column letters and numbers."""
+
+    def test_round_trip(self):
+        """Test that column letters survive a round trip through numbers."""
+        for letters, number in [("A", 1), ("J", 10), ("L", 12), ("Z", 26), ("AA", 27)]:
+            assert _column_number(letters) == number
+            assert _column_letters(number) == letters
+
+
+class TestLazyImport:
+    """Tests for deferring the xlwings import."""
+
+    def test_import_does_not_load_xlwings(self):
+        """Test that importing the module alone leaves xlwings unimported."""
+        # Fresh interpreter, as other tests in this session may have imported xlwings
+        src = Path(concrete_capacity.__file__).parent
+        code = (
+            f"import sys; sys.path.insert(0, {str(src)!r}); "
+            "import concrete_capacity; print('xlwings' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "False"
+
+
+class _RecordingSheet:
+    """Minimal stand-in for an xlwings Sheet that records range access."""
+
+    def __init__(self, values=None):
+        self.reads = []
+        self.writes = []
+        # Every access in order as (kind, cell), including calculate/solve from _RecordingWorkbook
+        self.events = []
+        # Values returned when reading a range, by its first cell (0 otherwise)
+        self.values = values or {}
+
+    def range(self, first, last=None):
+        sheet = self
+
+        class Cell:
+            @property
+            def raw_value(self):
+                sheet.reads.append(first)
+                sheet.events.append(("read", first))
+                return sheet.values.get(first, 0)
+
+            @raw_value.setter
+            def raw_value(self, value):
+                sheet.writes.append((first, last, value))
+                sheet.events.append(("write", first))
+
+        return Cell()
+
+    __getitem__ = range
+
+
+class _RecordingWorkbook:
+    """Minimal stand-in for an xlwings Book whose app logs recalculations to a _RecordingSheet."""
+
+    def __init__(self, sheet: _RecordingSheet):
+        self.app = SimpleNamespace(calculate=lambda: sheet.events.append(("calculate", None)))
+
+
+class _FakeApp:
+    """Stand-in for xlwings.App that records opened workbooks and quits."""
+
+    def __init__(self, visible=True, add_book=True):
+        self.visible = visible
+        self.calculation = "automatic"
+        self.screen_updating = True
+        self.enable_events = True
+        self.display_alerts = True
+        self.opened = []
+        self.quits = 0
+        self.books = SimpleNamespace(open=self._open)
+
+    def _open(self, path):
+        self.opened.append(path)
+        return SimpleNamespace(
+            app=self,
+            sheets=[_RecordingSheet()],
+            macro=lambda name: lambda: None,
+            close=lambda: None,
+        )
+
+    def quit(self):
+        self.quits += 1
+
+
+@pytest.fixture
+def fake_excel(monkeypatch) -> SimpleNamespace:
+    """Route the analyser's xlwings and atexit calls to fakes, recording the Apps started."""
+    apps = []
+    exit_hooks = []
+
+    def app(**kwargs):
+        apps.append(_FakeApp(**kwargs))
+        return apps[-1]
+
+    monkeypatch.setattr(concrete_capacity, "_xlwings", lambda: SimpleNamespace(App=app))
+    monkeypatch.setattr(
+        concrete_capacity,
+        "atexit",
+        SimpleNamespace(register=exit_hooks.append, unregister=exit_hooks.remove),
+    )
+    return SimpleNamespace(apps=apps, exit_hooks=exit_hooks)
+
+
+# Result rows J8:L8 and J19:L19 as read back from the spreadsheet
+_RESULT_VALUES = {"J8": ((400.0, None, 0.6),), "J19": ((180.0, None, 0.7),)}
+
+
+@pytest.fixture(scope="module")
+def dummy_spreadsheet(tmp_path_factory) -> Path:
+    """Empty stand-in spreadsheet, shared by tests that never open it in Excel."""
+    spreadsheet = tmp_path_factory.mktemp("spreadsheet") / "test.xlsm"
+    spreadsheet.touch()
+    return spreadsheet
+
+
 class TestConcreteCapacityAnalyser:
     """Tests for ConcreteCapacityAnalyser class."""
 
@@ -302,29 +507,262 @@ class TestConcreteCapacityAnalyser:
         with pytest.raises(FileNotFoundError, match="Spreadsheet not found"):
             ConcreteCapacityAnalyser(spreadsheet_path=fake_path)
 
-    def test_repr(self, tmp_path: Path):
-        """Test string representation."""
-        # Create a dummy spreadsheet file
-        spreadsheet = tmp_path / "test.xlsm"
-        spreadsheet.touch()
+    def test_init_without_validation(self, tmp_path: Path):
+        """Test that validate=False skips the existence check."""
+        fake_path = tmp_path / "nonexistent.xlsm"
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=fake_path, validate=False)
+        assert analyser.spreadsheet_path == fake_path
 
-        analyser = ConcreteCapacityAnalyser(spreadsheet_path=spreadsheet)
+    def test_repr(self, dummy_spreadsheet: Path):
+        """Test string representation."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
         repr_str = repr(analyser)
         assert "ConcreteCapacityAnalyser" in repr_str
         assert "test.xlsm" in repr_str
 
-    def test_custom_cells(self, tmp_path: Path):
+    def test_custom_cells(self, dummy_spreadsheet: Path):
         """Test analyser with custom cell mapping."""
-        spreadsheet = tmp_path / "test.xlsm"
-        spreadsheet.touch()
-
         custom_cells = SpreadsheetCells(depth="A1", width="A2")
         analyser = ConcreteCapacityAnalyser(
-            spreadsheet_path=spreadsheet,
+            spreadsheet_path=dummy_spreadsheet,
             cells=custom_cells
         )
         assert analyser.cells.depth == "A1"
 
+    def test_context_manager_keeps_open(self, dummy_spreadsheet: Path):
+        """Test that the context manager keeps the session open until exit."""
+        with ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet) as analyser:
+            assert isinstance(analyser, ConcreteCapacityAnalyser)
+            assert analyser._keep_open is True
+        assert analyser._keep_open is False
+
+    def test_close_without_workbook(self, dummy_spreadsheet: Path):
+        """Test that close is a no-op when no workbook is open."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet, keep_open=True)
+        analyser.close()
+        analyser.close()
+        assert analyser._workbook is None
+
+    def test_write_cells_skips_unchanged(self, dummy_spreadsheet: Path):
+        """Test that unchanged runs are not rewritten within a session."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        sheet = _RecordingSheet()
+        analyser._write_cells(sheet, {"K27": 1.0, "D35": 2.0, "D36": 3.0})
+        analyser._write_cells(sheet, {"K27": 1.0, "D35": 2.0, "D36": 4.0})
+        assert sheet.writes == [
+            ("K27", None, 1.0),
+            ("D35", "D36", [[2.0], [3.0]]),
+            ("D35", "D36", [[2.0], [4.0]]),
+        ]
+
+        analyser.close()
+        analyser._write_cells(sheet, {"K27": 1.0})
+        assert sheet.writes[-1] == ("K27", None, 1.0)
+
+    def test_cache_key_ignores_load_sign(self, dummy_spreadsheet: Path):
+        """Test that loads differing only in sign share a cache key."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        geometry = SectionGeometry(depth=500, width=300)
+        concrete = ConcreteProperties(strength=40)
+        reo = ReinforcementLayer(bar_size=20, spacings=(150,))
+
+        positive = analyser._cache_key(geometry, concrete, reo, reo, AppliedLoads(mz=100, fx=50))
+        negative = analyser._cache_key(geometry, concrete, reo, reo, AppliedLoads(mz=-100, fx=-50))
+        other = analyser._cache_key(geometry, concrete, reo, reo, AppliedLoads(mz=100, fx=60))
+        assert positive == negative
+        assert positive != other
+
+    def test_cache_key_with_list_spacings(self, dummy_spreadsheet: Path):
+        """Test that layers built from lists give the same, hashable key as tuples."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        geometry = SectionGeometry(depth=500, width=300)
+        concrete = ConcreteProperties(strength=40)
+        loads = AppliedLoads(mz=100)
+        from_list = ReinforcementLayer(bar_size=20, spacings=[150, 200])
+        from_tuple = ReinforcementLayer(bar_size=20, spacings=(150, 200))
+
+        key = analyser._cache_key(geometry, concrete, from_list, from_list, loads)
+        assert hash(key) == hash(
+            analyser._cache_key(geometry, concrete, from_tuple, from_tuple, loads)
+        )
+        analyser._store(key, UtilisationResult(0.5, 100.0, 200.0, 0.5))
+        result = analyser.calculate(geometry, concrete, from_list, from_list, loads)
+        assert result.ultimate_utilisation == 0.5
+
+    def test_cache_evicts_least_recently_used(self, dummy_spreadsheet: Path):
+        """Test that the result cache is bounded by cache_size."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet, cache_size=2)
+        result = UtilisationResult(0.5, 100.0, 200.0, 0.5)
+        analyser._store("a", result)
+        analyser._store("b", result)
+        assert analyser._cached("a") is result
+        analyser._store("c", result)
+        assert analyser._cached("b") is None
+        assert analyser._cached("a") is result
+
+        analyser.clear_cache()
+        assert analyser._cached("a") is None
+
+    def test_write_cells_fills_single_cell_gap(self, dummy_spreadsheet: Path):
+        """Test that a one-row gap is read once and merged into one write."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        sheet = _RecordingSheet()
+        analyser._write_cells(sheet, {"D33": 1.0, "D35": 2.0})
+        analyser._write_cells(sheet, {"D33": 3.0, "D35": 2.0})
+        assert sheet.reads == ["D34"]
+        assert sheet.writes == [
+            ("D33", "D35", [[1.0], [0], [2.0]]),
+            ("D33", "D35", [[3.0], [0], [2.0]]),
+        ]
+
+    def test_recalculates_after_solve(self, dummy_spreadsheet: Path):
+        """Test that results are read only after recalculating the solved workbook."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        sheet = _RecordingSheet(_RESULT_VALUES)
+        analyser._solve = lambda: sheet.events.append(("solve", None))
+        reo = ReinforcementLayer(bar_size=20, spacings=(150,))
+
+        result = analyser._perform_single_calculation(
+            sheet, _RecordingWorkbook(sheet), reo, reo, AppliedLoads(mz=100)
+        )
+        # The first read is the D34 gap between the load cells
+        kinds = [kind for kind, _ in groupby(kind for kind, _ in sheet.events)]
+        assert kinds == ["read", "write", "calculate", "solve", "calculate", "read"]
+        assert result == UtilisationResult(0.6, 400.0, 180.0, 0.7)
+
+    def test_numpy_inputs_written_as_python_numbers(self, dummy_spreadsheet: Path):
+        """Test that NumPy scalars are converted before reaching raw_value."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        sheet = _RecordingSheet(_RESULT_VALUES)
+        analyser._solve = lambda: None
+        reo = ReinforcementLayer(bar_size=np.int64(20), spacings=(np.float64(150),))
+        loads = AppliedLoads(mz=np.float64(-250), fx=np.float64(50))
+
+        analyser._perform_single_calculation(sheet, _RecordingWorkbook(sheet), reo, reo, loads)
+        written = [
+            value
+            for _, _, block in sheet.writes
+            for value in (
+                [row[0] for row in block] if isinstance(block, list) else [block]
+            )
+        ]
+        assert written
+        assert {type(value) for value in written} <= {int, float}
+
+    def test_invalid_early_stop_raises(self, dummy_spreadsheet: Path):
+        """Test that an unknown early_stop value raises ValueError."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        reo = ReinforcementLayer(bar_size=20, spacings=(150,))
+        with pytest.raises(ValueError, match="early_stop must be one of"):
+            analyser.calculate_batch(
+                SectionGeometry(depth=500, width=300),
+                ConcreteProperties(strength=40),
+                reo, reo, [AppliedLoads(mz=100)],
+                early_stop="always",
+            )
+
+    def test_early_stop_on_cached_results(self, dummy_spreadsheet: Path):
+        """Test that first_failure tries severe cases first and stops at a failure."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        geometry = SectionGeometry(depth=500, width=300)
+        concrete = ConcreteProperties(strength=40)
+        reo = ReinforcementLayer(bar_size=20, spacings=(150,))
+        loads_list = [AppliedLoads(mz=100), AppliedLoads(mz=200), AppliedLoads(mz=300)]
+        utilisations = [0.5, 1.2, 0.8]
+        for loads, utilisation in zip(loads_list, utilisations):
+            key = analyser._cache_key(geometry, concrete, reo, reo, loads)
+            analyser._store(key, UtilisationResult(utilisation, 100.0, 200.0, 0.5))
+
+        results = analyser.calculate_batch(
+            geometry, concrete, reo, reo, loads_list, early_stop="first_failure"
+        )
+        # mz=300 (passes) then mz=200 (fails); mz=100 is never reached
+        assert [r and r.ultimate_utilisation for r in results] == [None, 1.2, 0.8]
+
+        results = analyser.calculate_batch(
+            geometry, concrete, reo, reo, loads_list, early_stop="first_pass"
+        )
+        assert [r and r.ultimate_utilisation for r in results] == [0.5, None, None]
+
+
+class TestExcelSession:
+    """Tests for the analyser's Excel instance and workbook session, against a fake App."""
+
+    def test_hidden_app_reused(self, dummy_spreadsheet: Path, fake_excel):
+        """Test that one hidden Excel instance serves every session until close()."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        geometry = SectionGeometry(depth=500, width=300)
+        concrete = ConcreteProperties(strength=40)
+        for _ in range(2):
+            with analyser._session(geometry, concrete):
+                pass
+
+        (app,) = fake_excel.apps
+        assert app.visible is False
+        assert app.opened == [str(dummy_spreadsheet)] * 2
+        assert fake_excel.exit_hooks == [app.quit]
+
+        analyser.close()
+        assert app.quits == 1
+        assert fake_excel.exit_hooks == []
+
+    def test_session_restores_settings_on_error(self, dummy_spreadsheet: Path, fake_excel):
+        """Test that the calculation mode and other settings are restored when the block raises."""
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        with pytest.raises(RuntimeError, match="solve failed"):
+            with analyser._session(
+                SectionGeometry(depth=500, width=300), ConcreteProperties(strength=40)
+            ):
+                assert fake_excel.apps[0].calculation == "manual"
+                raise RuntimeError("solve failed")
+
+        app = fake_excel.apps[0]
+        assert app.calculation == "automatic"
+        assert app.enable_events is True
+        assert analyser._workbook is None
+
+    @pytest.mark.parametrize(
+        "cases, workers, chunk_sizes",
+        [(5, 2, [3, 2]), (6, 3, [2, 2, 2]), (7, 3, [3, 3, 1]), (2, 4, [1, 1])],
+    )
+    def test_parallel_chunks(
+        self, dummy_spreadsheet: Path, monkeypatch, cases, workers, chunk_sizes
+    ):
+        """Test that load cases are split into ordered, contiguous chunks, one per process."""
+        pools = []
+
+        class InlineExecutor:
+            def __init__(self, max_workers, initializer, initargs):
+                self.max_workers = max_workers
+                self.chunks = []
+                pools.append(self)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return None
+
+            def map(self, fn, args_list):
+                self.chunks = [args[-1] for args in args_list]
+                # Echo each chunk's loads back as its results
+                return self.chunks
+
+        monkeypatch.setattr(concrete_capacity, "ProcessPoolExecutor", InlineExecutor)
+        analyser = ConcreteCapacityAnalyser(spreadsheet_path=dummy_spreadsheet)
+        reo = ReinforcementLayer(bar_size=20, spacings=(150,))
+        loads_list = [AppliedLoads(mz=100 + i) for i in range(cases)]
+        results = analyser._calculate_parallel(
+            SectionGeometry(depth=500, width=300),
+            ConcreteProperties(strength=40),
+            reo, reo, loads_list, workers,
+        )
+
+        (pool,) = pools
+        assert [len(chunk) for chunk in pool.chunks] == chunk_sizes
+        assert pool.max_workers == len(chunk_sizes)
+        assert results == loads_list
+
 
 # Integration tests (require actual spreadsheet)
 # These tests are skipped by default unless the spreadsheet exists
@@ -332,6 +770,7 @@ class TestConcreteCapacityAnalyser:
 SPREADSHEET_PATH = Path(__file__).parent.parent / "src" / "RC Beam Design to AS3600 - 2018.xlsm"
 
 
+@pytest.mark.integration
 @pytest.mark.skipif(
     not SPREADSHEET_PATH.exists(),
     reason="Spreadsheet not found for integration tests"
@@ -339,22 +778,6 @@ SPREADSHEET_PATH = Path(__file__).parent.parent / "src" / "RC Beam Design to AS3
 class TestConcreteCapacityAnalyserIntegration:
     """Integration tests requiring the actual spreadsheet."""
 
-    @pytest.fixture
-    def analyser(self) -> ConcreteCapacityAnalyser:
-        """Create analyser with real spreadsheet."""
-        return ConcreteCapacityAnalyser(spreadsheet_path=SPREADSHEET_PATH)
-
-    @pytest.fixture
-    def typical_inputs(self):
-        """Typical input values for testing."""
-        return {
-            "geometry": SectionGeometry(depth=500, width=300),
-            "concrete": ConcreteProperties(strength=40),
-            "top_reo": ReinforcementLayer(bar_size=16, spacings=(200, 200)),
-            "bottom_reo": ReinforcementLayer(bar_size=20, spacings=(150, 150)),
-            "loads": AppliedLoads(mz=250, fx=50),
-        }
-
     def test_calculate_returns_result(self, analyser, typical_inputs):
         """Test that calculate returns a UtilisationResult."""
         result = analyser.calculate(
@@ -395,9 +818,38 @@ class TestConcreteCapacityAnalyserIntegration:
             loads_list=loads_list,
         )
         assert len(results) == 3
-        assert all(isinstance(r, UtilisationResult) for r in results)
-        # Higher moment should give higher utilisation
-        assert results[0].ultimate_utilisation < results[2].ultimate_utilisation
+        assert {type(r) for r in results} == {UtilisationResult}
+        # Higher moment should give higher utilisation, case by case
+        utilisations = np.fromiter(
+            (r.ultimate_utilisation for r in results), dtype=np.float64, count=len(results)
+        )
+        assert np.all(np.diff(utilisations) > 0)
+
+    @pytest.mark.parametrize("batch_size", [1, 5])
+    def test_batch_equals_sequential(self, analyser, typical_inputs, batch_size):
+        """Test that a batch gives the same results as calculating each case."""
+        section = (
+            typical_inputs["geometry"],
+            typical_inputs["concrete"],
+            typical_inputs["top_reo"],
+            typical_inputs["bottom_reo"],
+        )
+        loads_list = [AppliedLoads(mz=100 + i) for i in range(batch_size)]
+
+        # Clear the cache either side, so both the reference cases and the batch are solved in Excel
+        analyser.clear_cache()
+        expected = [analyser.calculate(*section, loads=loads) for loads in loads_list]
+        analyser.clear_cache()
+        results = analyser.calculate_batch(*section, loads_list=loads_list)
+
+        assert len(results) == batch_size
+        for result, reference_result in zip(results, expected):
+            assert result.ultimate_utilisation == pytest.approx(
+                reference_result.ultimate_utilisation
+            )
+            assert result.ultimate_strength == pytest.approx(
+                reference_result.ultimate_strength
+            )
 
     def test_calculate_batch_empty(self, analyser, typical_inputs):
         """Test batch calculation with empty list."""
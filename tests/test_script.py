@@ -0,0 +1,313 @@
+"""Tests for script module."""
+
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# script.py builds its file picker on customtkinter at import
+pytest.importorskip("customtkinter")
+
+import script
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _write_output_text(path, nodes, members):
+    """Write a SPACE GASS output text with NODES and MEMBERS tables, members given as (id, node 1, node 2)."""
+    node_lines = [f"{node},{x},{y},{z}" for node, (x, y, z) in nodes.items()]
+    member_lines = [f"{member},0.0,0,,N,{node_1},{node_2},1,1,FFFFFF,FFFFFF" + ",0.0" * 9
+                    for member, node_1, node_2 in members]
+    path.write_text("\n".join(["SPACE GASS Text File - Version 1420", "", "NODES", *node_lines,
+                               "MEMBERS", *member_lines, "MATERIALS", "END", ""]))
+    return path
+
+
+class _FakeSheet:
+    """Minimal stand-in for an xlwings Sheet that records writes and reads in app.events."""
+
+    def __init__(self, app):
+        self.app = app
+
+    def __getitem__(self, address):
+        sheet = self
+
+        class Cell:
+            @property
+            def value(self):
+                sheet.app.events.append(("read", address))
+                if address == "K27:K38":
+                    return [float(row) for row in range(27, 39)]
+                # J8:L19, with each row holding (strength, None, utilisation)
+                return [[100.0 + row, None, 0.5] for row in range(12)]
+
+            @value.setter
+            def value(self, value):
+                sheet.app.events.append(("write", address))
+
+        return Cell()
+
+
+class _FakeApp:
+    """Stand-in for xlwings.App that, like Excel, rejects a calculation mode with no workbook open."""
+
+    def __init__(self, visible=None, add_book=True):
+        self.events = []
+        self.books = SimpleNamespace(open=self._open)
+        self._calculation = "automatic"
+        self._workbook_open = False
+
+    def _open(self, path):
+        self.events.append(("open", path))
+        self._workbook_open = True
+        return SimpleNamespace(
+            sheets=[_FakeSheet(self)],
+            macro=lambda name: lambda: self.events.append(("solve", name)),
+        )
+
+    @property
+    def calculation(self):
+        return self._calculation
+
+    @calculation.setter
+    def calculation(self, value):
+        if not self._workbook_open:
+            raise RuntimeError("Unable to set the Calculation property with no workbook open")
+        self.events.append(("calculation", value))
+        self._calculation = value
+
+    def calculate(self):
+        self.events.append(("calculate", None))
+
+    def quit(self):
+        self.events.append(("quit", None))
+
+
+@pytest.fixture
+def fake_excel(monkeypatch):
+    """Route script's xlwings calls to _FakeApp, closing any capacity workbooks afterwards."""
+    apps = []
+
+    def app(**kwargs):
+        apps.append(_FakeApp(**kwargs))
+        return apps[-1]
+
+    monkeypatch.setattr(script, "xw", SimpleNamespace(App=app))
+    yield apps
+    script.close_capacity_workbooks()
+
+
+class TestCapacityWorkbook:
+    """Tests for the shared Concrete Capacity Excel session."""
+
+    def test_manual_calculation_set_after_open(self, fake_excel):
+        """Test that the calculation mode is only changed once the workbook is open."""
+        app, _, _, _ = script.load_capacity_workbook("capacity.xlsm")
+        kinds = [kind for kind, _ in app.events]
+        assert kinds.index("open") < kinds.index("calculation")
+        assert app.calculation == "manual"
+
+    def test_workbook_opened_once(self, fake_excel):
+        """Test that repeated loads reuse the open workbook and Excel instance."""
+        first = script.load_capacity_workbook("capacity.xlsm")
+        assert script.load_capacity_workbook("capacity.xlsm") is first
+        assert len(fake_excel) == 1
+
+    def test_close_restores_calculation(self, fake_excel):
+        """Test that closing puts back the previous calculation mode before quitting."""
+        app, _, _, _ = script.load_capacity_workbook("capacity.xlsm")
+        script.close_capacity_workbooks()
+        assert app.events[-2:] == [("calculation", "automatic"), ("quit", None)]
+        assert script._capacity_workbooks == {}
+
+
+class TestCalculateUtilisation:
+    """Tests for calculate_utilisation against the shared capacity workbook."""
+
+    def test_recalculates_after_solve(self, fake_excel):
+        """Test that inputs are written, recalculated, solved and recalculated before the read."""
+        result = script.calculate_utilisation(500, 300, 16, 200, 200, 20, 150, 150, 50, 0, 10, 0, 0, 250,
+                                              capacity_path="capacity.xlsm")
+        app = fake_excel[0]
+        solve_events = app.events[app.events.index(("calculation", "manual")) + 2:]
+        kinds = [kind for kind, _ in solve_events]
+        assert kinds == ["write"] * 6 + ["calculate", "solve", "calculate", "read"]
+        assert result == (0.5, 100.0, 111.0, 0.5)
+
+
+class TestImportSpacegassScript:
+    """Tests for writing and running the SPACE GASS scripts."""
+
+    @pytest.fixture
+    def master_rows(self, monkeypatch, tmp_path):
+        """Three master Excel rows, with scripts written to a temporary folder."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(script, "import_section_properties", lambda master_excel: pd.DataFrame({
+            script.first_column_name: ["Deck", "Pier", "Abutment"],
+            "Load Cases": ["1-10", "11-20", "21-30"],
+            "Section Filter Number": [1, 2, 3],
+        }))
+        return tmp_path
+
+    @pytest.fixture
+    def launches(self, master_rows, monkeypatch):
+        """Pick a model in master_rows and record the script each SPACE GASS launch runs."""
+        model = master_rows / "model.SG"
+        monkeypatch.setattr(script, "pick_spacegass_inputs", lambda: (model, master_rows, f'"{model}"'))
+        launches = []
+
+        def run(args, check, capture_output):
+            assert check and capture_output
+            launches.append(Path(args[-1]).name)
+
+        monkeypatch.setattr(script.subprocess, "run", run)
+        return launches
+
+    def test_cancelled_picker_runs_nothing(self, master_rows, monkeypatch):
+        """Test that closing the file picker returns without writing or running scripts."""
+        monkeypatch.setattr(script, "pick_spacegass_inputs", lambda: (None, None, None))
+        monkeypatch.setattr(script.subprocess, "run", pytest.fail)
+        assert script.import_spacegass_script("MASTER.xlsx") == []
+        assert script.import_spacegass_script("MASTER.xlsx", wait=False) == {}
+        assert list(master_rows.iterdir()) == []
+
+    def test_one_script_by_default(self, launches):
+        """Test that by default SPACE GASS is started once, opening the model once for every export."""
+        script_paths = script.import_spacegass_script("MASTER.xlsx")
+        assert [path.name for path in script_paths] == ["script.TXT"]
+        assert launches == ["script.TXT"]
+        script_text = script_paths[0].read_text()
+        assert script_text.count("ACTION OPEN") == 1
+        assert script_text.count("ACTION EXPORT_TXT") == 3
+
+    def test_rows_grouped_per_worker(self, launches):
+        """Test that with several workers the rows are split into one script per SPACE GASS instance."""
+        runs = script.import_spacegass_script("MASTER.xlsx", max_workers=2, wait=False)
+        script_paths = [Path(f"script_{i}.TXT") for i in (1, 2)]
+        for run in runs.values():
+            run.result()
+        assert sorted(launches) == ["script_1.TXT", "script_2.TXT"]
+        assert [path.read_text().count("ACTION OPEN") for path in script_paths] == [1, 1]
+        assert [path.read_text().count("ACTION EXPORT_TXT") for path in script_paths] == [2, 1]
+        assert "Cases=21-30" in script_paths[1].read_text()
+        # Each output text maps to the run of the script exporting it
+        assert runs["Deck1-10.txt"] is runs["Pier11-20.txt"]
+        assert runs["Abutment21-30.txt"] is not runs["Deck1-10.txt"]
+
+    def test_failed_run_leaves_nothing_running(self, master_rows, monkeypatch):
+        """Test that a failed export is raised only once no other SPACE GASS run is still going."""
+        model = master_rows / "model.SG"
+        monkeypatch.setattr(script, "pick_spacegass_inputs", lambda: (model, master_rows, f'"{model}"'))
+        started = []
+        finished = []
+
+        def run(args, check, capture_output):
+            if args[-1].endswith("script_1.TXT"):
+                raise script.subprocess.CalledProcessError(1, args)
+            started.append(Path(args[-1]).name)
+            time.sleep(0.05)
+            finished.append(Path(args[-1]).name)
+
+        monkeypatch.setattr(script.subprocess, "run", run)
+        with pytest.raises(script.subprocess.CalledProcessError):
+            script.import_spacegass_script("MASTER.xlsx", max_workers=2)
+        # The other run was either cancelled before it started or allowed to finish
+        assert finished == started
+
+
+class TestMasterRows:
+    """Tests for picking the runs out of the master Excel rows."""
+
+    def test_run_rows_and_output_names(self):
+        """Test that only named rows are run and each gets its output text name."""
+        df_properties = pd.DataFrame({
+            script.first_column_name: ["Deck", "Pier", np.nan],
+            "Load Cases": ["1-10", "11-20", np.nan],
+        })
+        df_runs = script.run_rows(df_properties)
+        assert len(df_runs) == 2
+        assert script.output_text_names(df_runs) == ["Deck1-10.txt", "Pier11-20.txt"]
+
+
+class TestOutputTextTables:
+    """Tests for reading the tables of a SPACE GASS output text."""
+
+    def test_parse_member_node_tables(self):
+        """Test that the MEMBERS and NODES tables are read with integer ids."""
+        df_members, df_nodes = script.parse_member_node_tables(FIXTURES_DIR / "minimal_sg_output.txt")
+        assert df_members["Member ID"].tolist() == [1, 2, 3]
+        assert df_members[["Node 1", "Node 2"]].to_numpy().tolist() == [[1, 2], [2, 3], [1, 4]]
+        assert df_members["Member ID"].dtype == np.int64
+        assert df_nodes["Node ID"].tolist() == [1, 2, 3, 4]
+        assert df_nodes.loc[3, ["x", "y", "z"]].tolist() == [0.0, 1.0, 0.0]
+
+    def test_table_spans_keep_first_heading(self):
+        """Test that each table runs to the next heading and a repeated heading keeps the first table."""
+        text = "NODES\n1,0,0,0\nMEMBERS\n1,2\nNODES\n9,9,9,9\n"
+        tables = script._table_spans(text)
+        assert script._table_text(text, tables, "NODES") == "1,0,0,0\n"
+        assert script._table_text(text, tables, "MEMBERS") == "1,2\n"
+
+    def test_missing_table_raises(self):
+        """Test that asking for a table the text doesn't have raises ValueError."""
+        with pytest.raises(ValueError, match="No SECTIONS table"):
+            script._table_text("NODES\n1,0,0,0\n", script._table_spans("NODES\n1,0,0,0\n"), "SECTIONS")
+
+
+class TestAverageMoment:
+    """Tests for finding the parallel members either side of a member."""
+
+    @pytest.fixture
+    def output_text(self, tmp_path):
+        """Member 1 runs in x, with parallel members offset in z and others that are never adjacent."""
+        return _write_output_text(
+            tmp_path / "model.txt",
+            nodes={1: (0, 0, 0), 2: (1, 0, 0), 3: (0, 0, -0.5), 4: (1, 0, -0.5), 5: (0, 0, -0.9), 6: (1, 0, -0.9),
+                   7: (0, 0, 0.4), 8: (1, 0, 0.4), 9: (-1, 0, 0), 10: (0, 0, 0.2), 11: (0, 0, 1.2)},
+            # 2 and 4 are the nearest parallel members each side, 3 is further out, 5 shares node 1 and 6 runs in z
+            members=[(1, 1, 2), (2, 3, 4), (3, 5, 6), (4, 7, 8), (5, 9, 1), (6, 10, 11)],
+        )
+
+    def test_nearest_parallel_members(self, output_text):
+        """Test that the closest parallel member without a shared node is found on each side."""
+        assert script.average_moment(output_text, 1) == (2, 4)
+
+    def test_member_without_neighbour(self, output_text):
+        """Test that a side with no candidate member gives None."""
+        assert script.average_moment(output_text, 4) == (1, None)
+
+    def test_changed_file_is_read_again(self, output_text):
+        """Test that cached lookups are dropped once the output text is re-exported."""
+        assert script.average_moment(output_text, 1) == (2, 4)
+        mtime_ns = output_text.stat().st_mtime_ns
+        _write_output_text(output_text, nodes={1: (0, 0, 0), 2: (1, 0, 0), 3: (0, 0, 0.3), 4: (1, 0, 0.3)},
+                           members=[(1, 1, 2), (2, 3, 4)])
+        os.utime(output_text, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+        assert script.average_moment(output_text, 1) == (None, 2)
+
+    def test_cached_geometry_is_read_only(self, output_text):
+        """Test that the shared member geometry can't be changed by a caller."""
+        geometry = script.load_member_geometry(output_text)
+        assert script.load_member_geometry(output_text) is geometry
+        with pytest.raises(ValueError):
+            geometry["mid_points"][0, 0] = 1.0
+
+
+class TestCalculateUtilisations:
+    """Tests for solving a list of utilisation jobs."""
+
+    def test_duplicate_jobs_solved_once(self, monkeypatch):
+        """Test that each distinct job is solved once and results follow the order of jobs."""
+        solved = []
+
+        def calculate_utilisation(*job):
+            solved.append(job)
+            return sum(job)
+
+        monkeypatch.setattr(script, "calculate_utilisation", calculate_utilisation)
+        assert script.calculate_utilisations([(1, 2), (3, 4), (1, 2)]) == [3, 7, 3]
+        assert solved == [(1, 2), (3, 4)]
@@ -1,25 +1,24 @@
 """Tests for sg_results module."""
 
+import os
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
-from sg_results import SGResults
+from sg_results import SGResults, load_results
 
 
 class TestFileLoading:
     """Tests for file loading and error handling."""
 
-    def test_load_minimal_file(self, minimal_file_path: Path):
+    def test_load_minimal_file(self, minimal_results: SGResults, minimal_file_path: Path):
         """Test loading a minimal SPACEGASS output file."""
-        results = SGResults(str(minimal_file_path))
-        assert results.filepath == minimal_file_path
+        assert minimal_results.filepath == minimal_file_path.resolve()
 
-    def test_load_example_file(self, example_file_path: Path):
+    def test_load_example_file(self, example_results: SGResults, example_file_path: Path):
         """Test loading the full example file."""
-        results = SGResults(str(example_file_path))
-        assert results.filepath == example_file_path
+        assert example_results.filepath == example_file_path.resolve()
 
     def test_file_not_found(self, tmp_path: Path):
         """Test that FileNotFoundError is raised for missing files."""
@@ -41,6 +40,31 @@ class TestFileLoading:
         assert "Sections" in summary
 
 
+class TestLoadResults:
+    """Tests for the cached load_results factory."""
+
+    def test_repeated_load_is_reused(self, minimal_file_path: Path):
+        """Test that an unchanged file is parsed once."""
+        results = load_results(str(minimal_file_path))
+        assert isinstance(results, SGResults)
+        assert load_results(str(minimal_file_path)) is results
+
+    def test_changed_file_is_parsed_again(self, minimal_file_path: Path, tmp_path: Path):
+        """Test that a modified file gives a new SGResults."""
+        path = tmp_path / "output.txt"
+        path.write_text(minimal_file_path.read_text())
+        first = load_results(str(path))
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_results(str(path)) is not first
+
+    def test_missing_file(self, tmp_path: Path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="SPACEGASS output file not found"):
+            load_results(str(tmp_path / "missing.txt"))
+
+
 class TestUnitsParsing:
     """Tests for UNITS line parsing."""
 
@@ -50,150 +74,75 @@ class TestUnitsParsing:
         assert isinstance(units, dict)
         assert len(units) > 0
 
-    def test_units_values(self, minimal_results: SGResults):
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [("LENGTH", "m"), ("FORCE", "kN"), ("MOMENT", "kNm"), ("SECTION", "mm")],
+    )
+    def test_units_values(self, minimal_results: SGResults, key: str, value: str):
         """Test specific unit values are correct."""
-        units = minimal_results.units
-        assert units.get("LENGTH") == "m"
-        assert units.get("FORCE") == "kN"
-        assert units.get("MOMENT") == "kNm"
-        assert units.get("SECTION") == "mm"
-
-
-class TestNodesParsing:
-    """Tests for NODES section parsing."""
-
-    def test_nodes_dataframe(self, minimal_results: SGResults):
-        """Test that nodes property returns a DataFrame."""
-        nodes = minimal_results.nodes
-        assert isinstance(nodes, pd.DataFrame)
-        assert not nodes.empty
-
-    def test_nodes_columns(self, minimal_results: SGResults):
-        """Test that nodes DataFrame has expected columns."""
-        nodes = minimal_results.nodes
-        assert "node_id" in nodes.columns
-        assert "x" in nodes.columns
-        assert "y" in nodes.columns
-        assert "z" in nodes.columns
-
-    def test_nodes_count(self, minimal_results: SGResults):
-        """Test correct number of nodes parsed."""
-        nodes = minimal_results.nodes
-        assert len(nodes) == 4
-
-    def test_nodes_values(self, minimal_results: SGResults):
-        """Test specific node values."""
-        nodes = minimal_results.nodes
-        node_1 = nodes[nodes["node_id"] == 1].iloc[0]
-        assert node_1["x"] == 0.0
-        assert node_1["y"] == 0.0
-        assert node_1["z"] == 0.0
-
-
-class TestMembersParsing:
-    """Tests for MEMBERS section parsing."""
-
-    def test_members_dataframe(self, minimal_results: SGResults):
-        """Test that members property returns a DataFrame."""
-        members = minimal_results.members
-        assert isinstance(members, pd.DataFrame)
-        assert not members.empty
-
-    def test_members_columns(self, minimal_results: SGResults):
-        """Test that members DataFrame has expected columns."""
-        members = minimal_results.members
-        assert "member_id" in members.columns
-        assert "node_i" in members.columns
-        assert "node_j" in members.columns
-
-    def test_members_count(self, minimal_results: SGResults):
-        """Test correct number of members parsed."""
-        members = minimal_results.members
-        assert len(members) == 3
-
-
-class TestMaterialsParsing:
-    """Tests for MATERIALS section parsing."""
-
-    def test_materials_dataframe(self, minimal_results: SGResults):
-        """Test that materials property returns a DataFrame."""
-        materials = minimal_results.materials
-        assert isinstance(materials, pd.DataFrame)
-        assert not materials.empty
-
-    def test_materials_columns(self, minimal_results: SGResults):
-        """Test that materials DataFrame has expected columns."""
-        materials = minimal_results.materials
-        assert "material_id" in materials.columns
-        assert "name" in materials.columns
-        assert "E" in materials.columns
-
-    def test_materials_values(self, minimal_results: SGResults):
-        """Test specific material values."""
-        materials = minimal_results.materials
-        mat_1 = materials[materials["material_id"] == 1].iloc[0]
-        assert mat_1["name"] == "Concrete"
-        assert mat_1["E"] == 32000
-
-
-class TestSectionsParsing:
-    """Tests for SECTIONS section parsing (multiline)."""
-
-    def test_sections_dataframe(self, minimal_results: SGResults):
-        """Test that sections property returns a DataFrame."""
-        sections = minimal_results.sections
-        assert isinstance(sections, pd.DataFrame)
-        assert not sections.empty
-
-    def test_sections_columns(self, minimal_results: SGResults):
-        """Test that sections DataFrame has expected columns."""
-        sections = minimal_results.sections
-        assert "section_id" in sections.columns
-        assert "name" in sections.columns
-
-    def test_sections_values(self, minimal_results: SGResults):
-        """Test specific section values."""
-        sections = minimal_results.sections
-        sec_1 = sections[sections["section_id"] == 1].iloc[0]
-        assert sec_1["name"] == "Test Section"
-
-
-class TestRestraintsParsing:
-    """Tests for RESTRAINTS section parsing (multiline)."""
-
-    def test_restraints_dataframe(self, minimal_results: SGResults):
-        """Test that restraints property returns a DataFrame."""
-        restraints = minimal_results.restraints
-        assert isinstance(restraints, pd.DataFrame)
-        assert not restraints.empty
-
-    def test_restraints_columns(self, minimal_results: SGResults):
-        """Test that restraints DataFrame has expected columns."""
-        restraints = minimal_results.restraints
-        assert "node_id" in restraints.columns
-        assert "restraint_code" in restraints.columns
-
-    def test_restraints_values(self, minimal_results: SGResults):
-        """Test specific restraint values."""
-        restraints = minimal_results.restraints
-        rest_1 = restraints[restraints["node_id"] == 1].iloc[0]
-        assert rest_1["restraint_code"] == "VVVRRR"
+        assert minimal_results.units.get(key) == value
+
+
+class TestSectionSchemas:
+    """Tests that each parsed section is a DataFrame with its expected columns."""
+
+    @pytest.mark.parametrize(
+        ("attr", "expected_cols", "expected_len"),
+        [
+            ("nodes", ["node_id", "x", "y", "z"], 4),
+            ("members", ["member_id", "node_i", "node_j"], 3),
+            ("materials", ["material_id", "name", "E"], None),
+            ("sections", ["section_id", "name"], None),
+            ("restraints", ["node_id", "restraint_code"], None),
+            ("titles", ["title"], 3),
+            ("displacements", ["load_case_id", "node_id", "dx", "dy", "dz"], None),
+            ("reactions", ["load_case_id", "node_id", "fx", "fy", "fz"], None),
+            ("member_forces_moments", ["load_case_id", "member_id"], None),
+        ],
+    )
+    def test_section_schema(
+        self, minimal_results: SGResults, attr: str, expected_cols: list, expected_len
+    ):
+        """Test the section is a non-empty DataFrame with the expected columns and rows."""
+        df = getattr(minimal_results, attr)
+        assert isinstance(df, pd.DataFrame)
+        assert not df.empty
+        assert set(expected_cols).issubset(df.columns)
+        if expected_len is not None:
+            assert len(df) == expected_len
+
+
+class TestSectionValues:
+    """Tests parsed section values against expected frames."""
+
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            (
+                "nodes",
+                {
+                    "node_id": [1, 2, 3, 4],
+                    "x": [0.0, 1.0, 2.0, 0.0],
+                    "y": [0.0, 0.0, 0.0, 1.0],
+                    "z": [0.0, 0.0, 0.0, 0.0],
+                },
+            ),
+            ("materials", {"material_id": [1], "name": ["Concrete"], "E": [32000]}),
+            ("sections", {"section_id": [1], "name": ["Test Section"]}),
+            ("restraints", {"node_id": [1], "restraint_code": ["VVVRRR"]}),
+        ],
+    )
+    def test_section_values(self, minimal_results: SGResults, attr: str, expected: dict):
+        """Test the section's key columns match the expected frame."""
+        df = getattr(minimal_results, attr)
+        pd.testing.assert_frame_equal(
+            df[list(expected)], pd.DataFrame(expected), check_dtype=False
+        )
 
 
 class TestTitlesParsing:
     """Tests for TITLES section parsing."""
 
-    def test_titles_dataframe(self, minimal_results: SGResults):
-        """Test that titles property returns a DataFrame."""
-        titles = minimal_results.titles
-        assert isinstance(titles, pd.DataFrame)
-        assert not titles.empty
-
-    def test_titles_count(self, minimal_results: SGResults):
-        """Test correct number of titles parsed."""
-        titles = minimal_results.titles
-        assert len(titles) == 3
-
     def test_titles_values(self, minimal_results: SGResults):
         """Test specific title values."""
         titles = minimal_results.titles
@@ -201,82 +150,49 @@ class TestTitlesParsing:
         assert "Live Load" in titles["title"].values
 
 
-class TestDisplacementsParsing:
-    """Tests for DISPLACEMENTS section parsing."""
-
-    def test_displacements_dataframe(self, minimal_results: SGResults):
-        """Test that displacements property returns a DataFrame."""
-        displacements = minimal_results.displacements
-        assert isinstance(displacements, pd.DataFrame)
-        assert not displacements.empty
-
-    def test_displacements_columns(self, minimal_results: SGResults):
-        """Test that displacements DataFrame has expected columns."""
-        displacements = minimal_results.displacements
-        assert "load_case_id" in displacements.columns
-        assert "node_id" in displacements.columns
-        assert "dx" in displacements.columns
-        assert "dy" in displacements.columns
-        assert "dz" in displacements.columns
-
-
-class TestReactionsParsing:
-    """Tests for REACTIONS section parsing."""
-
-    def test_reactions_dataframe(self, minimal_results: SGResults):
-        """Test that reactions property returns a DataFrame."""
-        reactions = minimal_results.reactions
-        assert isinstance(reactions, pd.DataFrame)
-        assert not reactions.empty
-
-    def test_reactions_columns(self, minimal_results: SGResults):
-        """Test that reactions DataFrame has expected columns."""
-        reactions = minimal_results.reactions
-        assert "load_case_id" in reactions.columns
-        assert "node_id" in reactions.columns
-        assert "fx" in reactions.columns
-        assert "fy" in reactions.columns
-        assert "fz" in reactions.columns
-
-
-class TestMemberForcesMomentsParsing:
-    """Tests for MEMBER FORCES AND MOMENTS section parsing."""
-
-    def test_member_forces_moments_dataframe(self, minimal_results: SGResults):
-        """Test that member_forces_moments property returns a DataFrame."""
-        forces = minimal_results.member_forces_moments
-        assert isinstance(forces, pd.DataFrame)
-        assert not forces.empty
-
-    def test_member_forces_moments_columns(self, minimal_results: SGResults):
-        """Test that member_forces_moments DataFrame has expected columns."""
-        forces = minimal_results.member_forces_moments
-        assert "load_case_id" in forces.columns
-        assert "member_id" in forces.columns
-
-
 class TestQueryForcesMoments:
     """Tests for query_forces_moments method."""
 
     def test_query_all(self, minimal_results: SGResults):
-        """Test query with no filters returns all data."""
+        """Test query with no filters returns a copy of the whole forces table."""
         result = minimal_results.query_forces_moments()
-        assert len(result) == len(minimal_results.member_forces_moments)
+        pd.testing.assert_frame_equal(result, minimal_results.member_forces_moments)
+        assert result is not minimal_results.member_forces_moments
+
+    def test_query_all_modified_copy(self, minimal_file_path: Path):
+        """Test that modifying an unfiltered result leaves later queries unchanged."""
+        results = SGResults(str(minimal_file_path))
+        expected = SGResults(str(minimal_file_path)).query_forces_moments()
+        modified = results.query_forces_moments()
+        modified.iloc[:, -1] = -1.0
+        pd.testing.assert_frame_equal(results.query_forces_moments(), expected)
 
     def test_query_by_load_case(self, minimal_results: SGResults):
         """Test filtering by single load case."""
         result = minimal_results.query_forces_moments(load_case_id=1)
-        assert all(result["load_case_id"] == 1)
+        assert set(result["load_case_id"].unique()) == {1}
 
     def test_query_by_member(self, minimal_results: SGResults):
         """Test filtering by single member."""
         result = minimal_results.query_forces_moments(member_id=1)
-        assert all(result["member_id"] == 1)
+        assert set(result["member_id"].unique()) == {1}
 
     def test_query_by_multiple_load_cases(self, minimal_results: SGResults):
         """Test filtering by multiple load cases."""
         result = minimal_results.query_forces_moments(load_case_id=[1, 2])
-        assert all(result["load_case_id"].isin([1, 2]))
+        assert set(result["load_case_id"].unique()) == {1, 2}
+
+    def test_query_matches_mask_filter(self, minimal_results: SGResults):
+        """Test combined filters keep the same rows, in order, as a boolean mask."""
+        df = minimal_results.member_forces_moments
+        expected = df[df["load_case_id"].isin([1, 2, 999]) & (df["member_id"] == 1)]
+        result = minimal_results.query_forces_moments(load_case_id=[1, 2, 999], member_id=1)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_query_unknown_id_returns_empty(self, minimal_results: SGResults):
+        """Test filtering by an id that is not in the results."""
+        result = minimal_results.query_forces_moments(member_id=[999])
+        assert result.empty
 
 
 class TestQueryMemberSections:
@@ -293,6 +209,14 @@ class TestQueryMemberSections:
         assert 'name' in result.columns  # from sections
         assert 'area' in result.columns  # from sections
 
+    def test_query_all_members_modified_copy(self, minimal_file_path: Path):
+        """Test that modifying an unfiltered result leaves the cached join unchanged."""
+        results = SGResults(str(minimal_file_path))
+        expected = SGResults(str(minimal_file_path)).query_member_sections()
+        modified = results.query_member_sections()
+        modified['area'] = -1.0
+        pd.testing.assert_frame_equal(results.query_member_sections(), expected)
+
     def test_query_single_member(self, minimal_results: SGResults):
         """Test filtering by single member ID."""
         result = minimal_results.query_member_sections(member_id=1)
@@ -341,24 +265,46 @@ class TestQueryMemberSections:
         with pytest.raises(TypeError, match="must be an int or list of ints"):
             minimal_results.query_member_sections(member_id="1")
 
-    def test_empty_members_returns_empty(self, minimal_results: SGResults):
+    def test_empty_members_returns_empty(self, minimal_file_path: Path):
         """Test that empty members table returns empty DataFrame."""
-        # Clear members DataFrame
-        minimal_results._dataframes['members'] = pd.DataFrame()
-        result = minimal_results.query_member_sections()
+        # Clear members DataFrame on a fresh instance, the fixture is shared
+        results = SGResults(str(minimal_file_path))
+        results._dataframes['members'] = pd.DataFrame()
+        result = results.query_member_sections()
         assert isinstance(result, pd.DataFrame)
         assert result.empty
 
-    def test_empty_sections_returns_members_only(self, minimal_results: SGResults):
+    def test_empty_sections_returns_members_only(self, minimal_file_path: Path):
         """Test that empty sections returns members without section properties."""
-        # Clear sections DataFrame
-        minimal_results._dataframes['sections'] = pd.DataFrame()
-        result = minimal_results.query_member_sections(member_id=1)
+        # Clear sections DataFrame on a fresh instance, the fixture is shared
+        results = SGResults(str(minimal_file_path))
+        results._dataframes['sections'] = pd.DataFrame()
+        result = results.query_member_sections(member_id=1)
         assert len(result) == 1
         assert 'member_id' in result.columns
         # Section columns should not be present
         assert 'area' not in result.columns
 
+    def test_join_rebuilt_when_sections_replaced(self, minimal_file_path: Path):
+        """Test that a cached join is not reused after the sections table changes."""
+        results = SGResults(str(minimal_file_path))
+        assert 'area' in results.query_member_sections(member_id=1).columns
+        results._dataframes['sections'] = pd.DataFrame()
+        assert 'area' not in results.query_member_sections(member_id=1).columns
+
+
+class TestLazyParsing:
+    """Tests for on-demand section parsing."""
+
+    def test_sections_parsed_on_first_access(self, minimal_file_path: Path):
+        """Test that a section is only parsed when its property is used."""
+        results = SGResults(str(minimal_file_path))
+        assert 'nodes' not in results._dataframes
+
+        nodes = results.nodes
+        assert 'nodes' in results._dataframes
+        assert results.nodes is nodes
+
 
 class TestEmptySections:
     """Tests for empty/missing section handling."""
@@ -370,35 +316,61 @@ class TestEmptySections:
         assert isinstance(harmonic, pd.DataFrame)
         assert harmonic.empty
 
-
+    def test_empty_section_is_reused(self, minimal_results: SGResults):
+        """Test that a missing section returns the same DataFrame each time."""
+        assert minimal_results.harmonic_loads is minimal_results.harmonic_loads
+
+
+class TestNumericConversion:
+    """Tests for numeric column conversion."""
+
+    def test_integer_column(self, minimal_results: SGResults):
+        """Test that a column of plain integers becomes int64."""
+        values = minimal_results._convert_numeric_column(('1', '2', '30'))
+        assert values.dtype == 'int64'
+        assert list(values) == [1, 2, 30]
+
+    def test_float_column(self, minimal_results: SGResults):
+        """Test that a column of plain numbers becomes float64."""
+        values = minimal_results._convert_numeric_column(('1', '-2.5', '1e-3'))
+        assert values.dtype == 'float64'
+        assert list(values) == [1.0, -2.5, 0.001]
+
+    def test_mostly_numeric_column_with_blanks(self, minimal_results: SGResults):
+        """Test that blanks in a mostly numeric column become NaN."""
+        values = minimal_results._convert_numeric_column(('1.5', '2', None, 'x', '4'))
+        assert values[0] == 1.5
+        assert pd.isna(values[2]) and pd.isna(values[3])
+
+    def test_numeric_section_read_in_one_pass(self, minimal_results: SGResults):
+        """Test that a quote-free numeric section is read by the C parser."""
+        lines = ['       1,  0.5    , -2.0E-01\n', '       2,  1.5    ,  3\n']
+        df = minimal_results._read_numeric_section('NODES', lines)
+        assert list(df.columns) == ['node_id', 'x', 'y']
+        assert df['node_id'].dtype == 'int64'
+        assert df['y'].tolist() == [-0.2, 3.0]
+
+    def test_section_with_blanks_falls_back(self, minimal_results: SGResults):
+        """Test that sections with blank fields use line-by-line parsing."""
+        lines = ['1,2\n', '3,\n']
+        assert minimal_results._read_numeric_section('NODES', lines) is None
+        df = minimal_results._parse_simple_section('NODES', lines)
+        assert df['node_id'].tolist() == [1, 3]
+
+    def test_text_column_unchanged(self, minimal_results: SGResults):
+        """Test that a mostly text column is kept as strings."""
+        values = minimal_results._convert_numeric_column(('Y', 'N', '1'))
+        assert values == ['Y', 'N', '1']
+
+
+@pytest.mark.integration
 class TestExampleFileIntegration:
     """Integration tests using the full example file."""
 
-    def test_example_loads_successfully(self, example_results: SGResults):
-        """Test that the full example file loads without errors."""
-        assert example_results is not None
-
-    def test_example_has_nodes(self, example_results: SGResults):
-        """Test that example file has nodes parsed."""
-        assert not example_results.nodes.empty
+    def test_example_file_parsed(self, example_results: SGResults):
+        """Test that the full example file has its main sections and unit types."""
         assert len(example_results.nodes) > 10
-
-    def test_example_has_members(self, example_results: SGResults):
-        """Test that example file has members parsed."""
-        assert not example_results.members.empty
         assert len(example_results.members) > 10
-
-    def test_example_has_sections(self, example_results: SGResults):
-        """Test that example file has sections parsed."""
         assert not example_results.sections.empty
-
-    def test_example_has_materials(self, example_results: SGResults):
-        """Test that example file has materials parsed."""
         assert not example_results.materials.empty
-
-    def test_example_units_complete(self, example_results: SGResults):
-        """Test that example file has all expected unit types."""
-        units = example_results.units
-        expected_keys = ["LENGTH", "FORCE", "MOMENT", "SECTION"]
-        for key in expected_keys:
-            assert key in units
+        assert {"LENGTH", "FORCE", "MOMENT", "SECTION"} <= example_results.units.keys()